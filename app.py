@@ -2,14 +2,15 @@
 import streamlit as st
 import sys
 import os
-import requests
 from pathlib import Path
 from typing import List, Dict, Any
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.config.constants import GITHUB_REQUEST_TIMEOUT
 from src.core.crew import DocumentationCrew, extract_markdown_from_response
+from src.utils.http import get_http_session
 from src.utils.logger import setup_logger
 from src.utils.validators import validate_github_repo
 from src.config.settings import get_settings
@@ -46,13 +47,14 @@ def fetch_user_repos(github_token: str, github_api_url: str) -> List[Dict[str, A
             'Accept': 'application/vnd.github.v3+json',
             'X-GitHub-Api-Version': '2022-11-28'
         }
+        session = get_http_session()
         repos = []
         page = 1
         per_page = 100
 
         while True:
             url = f'{github_api_url}/user/repos'
-            response = requests.get(
+            response = session.get(
                 url,
                 headers=headers,
                 params={
@@ -62,7 +64,7 @@ def fetch_user_repos(github_token: str, github_api_url: str) -> List[Dict[str, A
                     'direction': 'desc',
                     'affiliation': 'owner,collaborator,organization_member'
                 },
-                timeout=30
+                timeout=GITHUB_REQUEST_TIMEOUT
             )
 
             if response.status_code != 200:
@@ -132,7 +134,7 @@ def verify_github_token(github_token: str, github_api_url: str) -> bool:
             'X-GitHub-Api-Version': '2022-11-28'
         }
         url = f'{github_api_url}/user'
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_session().get(url, headers=headers, timeout=10)
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Error verifying GitHub token: {e}")
@@ -467,7 +469,16 @@ if generate_button:
                 progress_bar.progress(30)
 
                 with st.spinner(f"Agents are collaborating to create your learning path..."):
-                    documentation = doc_crew.generate_documentation(repo_input)
+                    documentation = {}
+                    for event in doc_crew.generate_documentation_stream(repo_input):
+                        if event["stage"] == "fetched":
+                            status_text.text("Repository data fetched, writing learning path...")
+                            progress_bar.progress(55)
+                        elif event["stage"] == "written":
+                            status_text.text("Learning path written, finalizing...")
+                            progress_bar.progress(75)
+                        elif event["stage"] == "done":
+                            documentation = event["documentation"]
 
                 progress_bar.progress(80)
                 status_text.text("Saving learning path...")
@@ -28,6 +28,9 @@ Examples:
   # Include Google Drive search for reference documentation
   python scripts/run_documentation_agent.py owner/repo --with-drive
 
+  # Render straight from the GitHub data, without LLM calls
+  python scripts/run_documentation_agent.py owner/repo --fast
+
   # Specify custom output file
   python scripts/run_documentation_agent.py owner/repo --output my-docs.md
         """
@@ -45,6 +48,12 @@ Examples:
         help='Enable Google Drive search for reference documentation (requires GOOGLE_DRIVE_TOKEN)'
     )
 
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Render the learning path from GitHub data without LLM calls (ignored with --with-drive)'
+    )
+
     parser.add_argument(
         '--output',
         '-o',
@@ -84,6 +93,7 @@ def main():
     print("=" * 80)
     print(f"Repository: {args.repo}")
     print(f"Google Drive integration: {'ENABLED' if args.with_drive else 'DISABLED'}")
+    print(f"Fast mode: {'ENABLED' if args.fast and not args.with_drive else 'DISABLED'}")
     print("=" * 80)
     print()
 
@@ -96,7 +106,7 @@ def main():
 
         # Generate documentation
         logger.info(f"Generating documentation for repository: {args.repo}")
-        documentation = doc_crew.generate_documentation(args.repo)
+        documentation = doc_crew.generate_documentation(args.repo, fast_mode=args.fast)
 
         # Save to file
         output_file = doc_crew.save_documentation(documentation, args.output)
@@ -1,15 +1,19 @@
 """Agent factory functions for creating CrewAI agents"""
+from typing import TYPE_CHECKING
+
 from crewai import Agent
 
 from src.tools import GitHubTool, GoogleDriveMCPTool, GitHubCodeQATool
-from src.llm import OpenAILLM
 from src.config.constants import AgentRole
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from src.llm import OpenAILLM
+
 logger = setup_logger(__name__)
 
 
-def create_github_analyzer_agent(llm: OpenAILLM, github_tool: GitHubTool) -> Agent:
+def create_github_analyzer_agent(llm: "OpenAILLM", github_tool: GitHubTool) -> Agent:
     """
     Create an agent specialized in fetching GitHub data using tools.
 
@@ -41,7 +45,7 @@ def create_github_analyzer_agent(llm: OpenAILLM, github_tool: GitHubTool) -> Age
     )
 
 
-def create_drive_analyzer_agent(llm: OpenAILLM, drive_tool: GoogleDriveMCPTool) -> Agent:
+def create_drive_analyzer_agent(llm: "OpenAILLM", drive_tool: GoogleDriveMCPTool) -> Agent:
     """
     Create an agent specialized in searching Google Drive for reference documentation.
 
@@ -71,7 +75,7 @@ def create_drive_analyzer_agent(llm: OpenAILLM, drive_tool: GoogleDriveMCPTool)
     )
 
 
-def create_learning_path_writer_agent(llm: OpenAILLM) -> Agent:
+def create_learning_path_writer_agent(llm: "OpenAILLM") -> Agent:
     """
     Create an agent specialized in writing learning paths based on gathered data.
 
@@ -107,7 +111,7 @@ def create_learning_path_writer_agent(llm: OpenAILLM) -> Agent:
 create_documentation_writer_agent = create_learning_path_writer_agent
 
 
-def create_code_qa_agent(llm: OpenAILLM, code_qa_tool: GitHubCodeQATool) -> Agent:
+def create_code_qa_agent(llm: "OpenAILLM", code_qa_tool: GitHubCodeQATool) -> Agent:
     """
     Create an agent specialized in answering questions about repository code.
 
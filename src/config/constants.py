@@ -1,5 +1,6 @@
 """Constants for the documentation generation system"""
 from enum import Enum
+from pathlib import Path
 
 
 class LLMModel(str, Enum):
@@ -26,4 +27,42 @@ class ToolName(str, Enum):
 DEFAULT_TEMPERATURE_TOOL_CALLING = 0.3
 DEFAULT_TEMPERATURE_WRITING = 0.6
 DEFAULT_DRIVE_TOP_K = 3
+DRIVE_PREVIEW_CHARS = 2000  # Longest Drive file preview returned (and cached) per file
 DEFAULT_REQUEST_TIMEOUT = 300
+MIN_ACCESS_TOKEN_LENGTH = 20  # Tokens are usually at least 20 characters
+DEFAULT_MAX_TOKENS_TOOL_CALLING = 1024  # Writing LLMs are uncapped so long learning paths are not truncated
+DEFAULT_LLM_MAX_RETRIES = 3
+DEFAULT_BATCH_CONCURRENCY = 4
+IO_POOL_MAX_WORKERS = 16  # Threads shared by all tools for blocking HTTP calls
+# Pooled connections per host: one per I/O thread plus one per crew thread calling tools directly
+HTTP_POOL_MAXSIZE = IO_POOL_MAX_WORKERS + DEFAULT_BATCH_CONCURRENCY
+HTTP_MAX_RETRIES = 3  # Retries for idempotent tool HTTP requests on 502/503/504 and connection errors
+HTTP_RETRY_BACKOFF_FACTOR = 1  # Exponential backoff base in seconds between those retries
+HTTP_POOL_CONNECTIONS = 4  # Distinct hosts kept pooled (GitHub API, MCP server, ...)
+GITHUB_REQUEST_TIMEOUT = (3.05, 30)  # (connect, read) seconds: fail fast on unreachable hosts, allow slow bodies
+GITHUB_FETCH_CONCURRENCY = 5  # Parallel file downloads per repository, below GitHub's abuse limits
+GITHUB_ETAG_CACHE_SIZE = 512  # GitHub responses kept for If-None-Match revalidation
+GITHUB_ETAG_CACHE_TTL = 86400  # Seconds before a stored GitHub response is dropped outright
+GITHUB_RATE_LIMIT_RESERVE = 10  # Requests left in the hourly quota before GitHub calls wait for the reset
+GITHUB_RATE_LIMIT_MAX_WAIT = 60  # Longest pause, in seconds, for a rate limit reset or Retry-After
+GITHUB_OVERVIEW_CACHE_SIZE = 128  # Repositories whose analyzer results are kept in memory
+GITHUB_OVERVIEW_CACHE_TTL = 900  # Seconds an analyzer result for one HEAD commit is reused (stars etc. refresh)
+ROOT_LISTING_LIMIT = 20  # Root directory entries reported by the analyzer; a full listing means it was cut
+# Generated learning paths keyed by repo HEAD SHA, at the project root so the CLI
+# and the Streamlit app share one cache wherever they are launched from
+DOCUMENTATION_CACHE_DIR = str(Path(__file__).resolve().parents[2] / ".tara_cache")
+DOCUMENTATION_CACHE_TTL = 7 * 86400  # Seconds a cached learning path is served before it is regenerated
+DOCUMENTATION_CACHE_MAX_ENTRIES = 256  # Cached learning paths kept on disk; the oldest are deleted first
+QA_MAX_CHARS_PER_FILE = 40000  # File content kept per file in a code Q&A response
+QA_MAX_TOTAL_CHARS = 200000  # File content kept across a whole code Q&A response
+QA_CODE_CACHE_SIZE = 64  # (repo, commit, directory) code fetches kept in memory
+QA_CODE_CACHE_TTL = 3600  # Seconds a commit-keyed code fetch is kept
+DEFAULT_BRANCH_TTL = 300  # Seconds a repository's default branch name is trusted
+BRANCH_SHA_TTL = 60  # Seconds a resolved branch head SHA is trusted
+TOOL_AVAILABILITY_TTL = 60  # Seconds before a cached tool health probe is re-run
+DRIVE_TOOL_CACHE_SIZE = 32  # Drive tools (one per access token) kept for reuse across crews
+DRIVE_TOOL_CACHE_TTL = 3600  # Seconds after its last health probe that an unused Drive tool is dropped
+DRIVE_CACHE_SIZE = 256  # Drive search results and file previews kept in memory per tool
+DRIVE_SEARCH_CACHE_TTL = 300  # Seconds a Drive search result list is reused
+DRIVE_FILE_CACHE_TTL = 900  # Seconds a fetched Drive file's preview is reused
+MCP_GET_FILE_TIMEOUT = 180  # Seconds a Drive get_file call, or a batch_execute of several, may take
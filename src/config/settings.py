@@ -4,6 +4,8 @@ from typing import Optional
 from dotenv import load_dotenv
 from dataclasses import dataclass
 
+from src.config.constants import DEFAULT_LLM_MAX_RETRIES
+
 # Load environment variables
 load_dotenv()
 
@@ -48,6 +50,7 @@ class LLMConfig:
     """LLM configuration for OpenAI"""
     api_key: str
     timeout: int
+    max_retries: int
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -57,7 +60,8 @@ class LLMConfig:
 
         return cls(
             api_key=api_key,
-            timeout=int(os.getenv("LLM_TIMEOUT", "300"))
+            timeout=int(os.getenv("LLM_TIMEOUT", "300")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", DEFAULT_LLM_MAX_RETRIES))
         )
 
 
@@ -1,42 +1,311 @@
 """Core crew orchestration for documentation generation"""
+import hashlib
 import json
+import os
+import queue
 import re
-from typing import Dict, Optional, List
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, Iterator, Optional, List, Tuple
 from crewai import Agent, Task, Crew, Process
 
 from src.config.settings import get_settings
-from src.config.constants import LLMModel
-from src.tools import GitHubTool, GoogleDriveMCPTool, GitHubCodeQATool
+from src.config.constants import (
+    LLMModel,
+    TOOL_AVAILABILITY_TTL,
+    DRIVE_TOOL_CACHE_SIZE,
+    DRIVE_TOOL_CACHE_TTL,
+    DOCUMENTATION_CACHE_DIR,
+    DOCUMENTATION_CACHE_TTL,
+    DOCUMENTATION_CACHE_MAX_ENTRIES,
+    DEFAULT_BATCH_CONCURRENCY
+)
+from src.tools import GitHubTool, GoogleDriveMCPTool, GitHubCodeQATool, get_shared_github_tool
+from src.utils.cache import TTLCache
+from src.utils.concurrency import run_io
 from src.utils.logger import setup_logger
+from src.utils.serialization import to_compact_json
 from src.utils.validators import validate_github_repo, sanitize_filename
 
 logger = setup_logger(__name__)
 
+# Optional ```markdown / ```md / ``` opening fence and optional closing fence, in one pass
+_FENCE_RE = re.compile(r'\A```(?:markdown|md)?[ \t]*\n(.*?)(?:\n```\s*)?\Z', re.DOTALL)
+_FENCE_INFO_STRINGS = ("", "markdown", "md")
+
+# JSON keys that may wrap the markdown, in priority order
+_MARKDOWN_KEYS = ("markdown_documentation", "documentation", "content", "markdown")
+
+# Task prompts are parsed once at import time and filled per call with Template.substitute;
+# $-placeholders keep literal braces (e.g. JSON examples) usable without escaping.
+# Per-call values go at the end so every call shares the same static prefix,
+# which prompt-prefix caching (OpenAI, vLLM --enable-prefix-caching) can reuse.
+_FETCH_TASK_DESCRIPTION = Template(
+    "Use the GitHub Project Analyzer tool to fetch data for the repository below. "
+    "Return the complete JSON response.\n\n"
+    "REPOSITORY: $repo"
+)
+_FETCH_TASK_EXPECTED_OUTPUT = "The JSON data from the GitHub Project Analyzer tool"
+
+_WRITE_TASK_DESCRIPTION = """Format the GitHub data into a Markdown learning path with these sections:
+# Learning Path: [repository name]
+
+## Overview
+- Description, URL, language, stars, forks
+
+## Recent Contributors
+- List each commit with author and message
+
+## Repository Structure
+- List the files
+
+## Code Snippets
+- Show any code snippets from the data
+
+## README
+- Show the README content
+
+## Getting Started
+- Clone command and basic setup
+
+Use ONLY data from the previous task. Do not invent anything."""
+_WRITE_TASK_EXPECTED_OUTPUT = "A Markdown learning path using only the provided data"
+
+_QA_TASK_DESCRIPTION = Template("""You are chatting with a user about a repository.
+
+Instructions:
+1. Use the GitHub Code Q&A tool to fetch code from the directory given below
+2. Answer the user's question based on the actual code
+3. If this is a follow-up question, use the conversation context
+4. Quote relevant code snippets in your answer
+5. Be conversational and helpful
+
+REPOSITORY: $repo
+DIRECTORY: $directory
+$context
+USER'S CURRENT QUESTION: $question""")
+_QA_TASK_EXPECTED_OUTPUT = "A helpful, conversational answer about the code with examples"
+
+# Tool instances shared across DocumentationCrew constructions, with the time
+# of their last MCP health probe. Tools for users who stopped calling expire
+_drive_tools = TTLCache(maxsize=DRIVE_TOOL_CACHE_SIZE, ttl=DRIVE_TOOL_CACHE_TTL)
+
+
+def _get_drive_tool(access_token: str, mcp_url: str) -> GoogleDriveMCPTool:
+    """
+    Return a shared GoogleDriveMCPTool for the given credentials.
+
+    The MCP health probe is re-run only when the cached result is older
+    than TOOL_AVAILABILITY_TTL seconds. Probes run without any lock held, so
+    a slow MCP server never blocks crews for other users.
+    """
+    key = (access_token, mcp_url)
+    cached = _drive_tools.get(key)
+    if cached is not None:
+        tool, probed_at = cached
+        if time.monotonic() - probed_at < TOOL_AVAILABILITY_TTL:
+            return tool
+        tool._initialize_mcp()
+    else:
+        tool = GoogleDriveMCPTool(access_token=access_token, mcp_url=mcp_url)
+
+    _drive_tools.set(key, (tool, time.monotonic()))
+    return tool
+
 
 def extract_markdown_from_response(response: str) -> str:
     """Extract and clean markdown content from various response formats."""
     content = response.strip()
 
-    try:
-        data = json.loads(content)
-        if isinstance(data, dict):
-            for key in ["markdown_documentation", "documentation", "content", "markdown"]:
-                if key in data and data[key]:
-                    content = data[key]
-                    break
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    if content.startswith('```markdown') or content.startswith('```md'):
-        content = re.sub(r'^```(?:markdown|md)\s*\n', '', content)
-        content = re.sub(r'\n```\s*$', '', content)
-    elif content.startswith('```'):
-        content = re.sub(r'^```\s*\n', '', content)
-        content = re.sub(r'\n```\s*$', '', content)
+    # Fast path: plain markdown is neither a JSON object nor fenced
+    if not content or content[0] not in '{`':
+        return content
+
+    if content[0] == '{':
+        try:
+            data = json.loads(content)
+            if isinstance(data, dict):
+                content = next((data[key] for key in _MARKDOWN_KEYS if data.get(key)), content)
+        except (json.JSONDecodeError, ValueError):
+            pass
+
+    if content.startswith('```'):
+        # Common fenced case without trailing whitespace is handled by slicing
+        first_newline = content.find('\n')
+        if (
+            first_newline != -1
+            and content[3:first_newline].strip() in _FENCE_INFO_STRINGS
+            and content.endswith('\n```')
+        ):
+            return content[first_newline + 1:-4].strip()
+
+        match = _FENCE_RE.match(content)
+        if match:
+            content = match.group(1)
 
     return content.strip()
 
 
+def _read_cached_documentation(cache_path: Path) -> Optional[Dict]:
+    """Return a cached learning path, or None if it is missing, expired or unreadable."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > DOCUMENTATION_CACHE_TTL:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+    if not isinstance(cached, dict) or not isinstance(cached.get("documentation"), str):
+        logger.warning(f"Ignoring malformed cache entry {cache_path}")
+        return None
+    return cached
+
+
+def _write_cached_documentation(cache_path: Path, documentation: Dict) -> None:
+    """Store a learning path atomically, then delete the oldest entries beyond the size cap."""
+    cache_dir = cache_path.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".entry_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(documentation, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    entries = []
+    for entry in cache_dir.glob("*.json"):
+        try:
+            entries.append((entry.stat().st_mtime, entry))
+        except OSError:
+            continue  # Removed by a concurrent prune
+    entries.sort(reverse=True)
+    for _, entry in entries[DOCUMENTATION_CACHE_MAX_ENTRIES:]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+def _drop_empty(value: Any) -> Any:
+    """Recursively drop None and empty values from dicts and lists."""
+    if isinstance(value, dict):
+        return {
+            key: _drop_empty(item)
+            for key, item in value.items()
+            if item not in (None, "", [], {})
+        }
+    if isinstance(value, list):
+        return [_drop_empty(item) for item in value if item not in (None, "", [], {})]
+    return value
+
+
+def _extract_json_object(raw: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON object embedded in an agent's output, or None if there is none."""
+    start, end = raw.find('{'), raw.rfind('}')
+    if start == -1 or end <= start:
+        return None
+    try:
+        data = json.loads(raw[start:end + 1])
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _is_repository_data(raw: str) -> bool:
+    """Whether the fetch task's output holds GitHub analyzer data rather than an error."""
+    data = _extract_json_object(raw)
+    return data is not None and "error" not in data
+
+
+def _compact_context(raw: str) -> str:
+    """
+    Shrink the fetch task's output before it is handed to the writer task.
+
+    The fetch agent often echoes the analyzer's JSON pretty-printed; this
+    re-serializes it without whitespace and drops empty fields. The analyzer
+    already caps snippets and the root listing, so nothing else is cut.
+    Output that does not contain a JSON object is returned unchanged.
+    """
+    data = _extract_json_object(raw)
+    if data is None:
+        return raw
+    return to_compact_json(_drop_empty(data))
+
+
+def _render_learning_path(data: Dict[str, Any]) -> str:
+    """
+    Render GitHub analyzer data into the learning path layout the writer task produces.
+
+    Args:
+        data: Parsed GitHub Project Analyzer output
+
+    Returns:
+        Markdown learning path built only from the given data
+    """
+    repo = data.get("repository", "")
+    info = data.get("info") or {}
+    not_available = "Not available"
+
+    lines = [f"# Learning Path: {info.get('full_name') or repo}", "", "## Overview"]
+    lines.append(f"- **Description:** {info.get('description') or not_available}")
+    lines.append(f"- **URL:** {info.get('html_url') or not_available}")
+    lines.append(f"- **Language:** {info.get('language') or not_available}")
+    lines.append(f"- **Stars:** {info.get('stargazers_count', not_available)}")
+    lines.append(f"- **Forks:** {info.get('forks_count', not_available)}")
+
+    lines += ["", "## Recent Contributors"]
+    commits = [c for c in data.get("recent_commits") or [] if "error" not in c]
+    if commits:
+        for commit in commits:
+            lines.append(
+                f"- **{commit.get('author_name')}**: {commit.get('message')} "
+                f"([{commit.get('sha')}]({commit.get('html_url')}))"
+            )
+    else:
+        lines.append(f"- {not_available}")
+
+    lines += ["", "## Repository Structure"]
+    files = (data.get("file_structure") or {}).get("files") or []
+    if files:
+        for item in files:
+            lines.append(f"- `{item.get('path')}` ({item.get('type')})")
+    else:
+        lines.append(f"- {not_available}")
+
+    lines += ["", "## Code Snippets"]
+    snippets = data.get("code_snippets") or {}
+    snippet_items = [(name, snip) for name, snip in snippets.items() if isinstance(snip, dict)]
+    if snippet_items:
+        for name, snippet in snippet_items:
+            lines += ["", f"### [{name}]({snippet.get('link')})", "```", snippet.get("content", ""), "```"]
+    else:
+        lines.append(not_available)
+
+    lines += ["", "## README", "", data.get("readme") or not_available]
+
+    clone_url = f"{info['html_url']}.git" if info.get("html_url") else f"https://github.com/{repo}.git"
+    lines += [
+        "", "## Getting Started", "", "```bash",
+        f"git clone {clone_url}",
+        f"cd {info.get('name') or repo.split('/')[-1]}",
+        "```"
+    ]
+
+    return "\n".join(lines)
+
+
 class DocumentationCrew:
     """
     CrewAI setup for generating documentation from GitHub repositories.
@@ -50,14 +319,14 @@ class DocumentationCrew:
         self.settings = get_settings()
         self.enable_google_drive = enable_google_drive
 
-        # Initialize tools
-        logger.info("Initializing tools...")
-        self.github_tool = GitHubTool()
-
+        # GitHub tools are created lazily on first use (see github_tool / code_qa_tool)
         self.drive_tool = None
         if enable_google_drive:
             if self.settings.google_drive.is_configured():
-                self.drive_tool = GoogleDriveMCPTool()
+                self.drive_tool = _get_drive_tool(
+                    self.settings.google_drive.token,
+                    self.settings.google_drive.mcp_url
+                )
                 if self.drive_tool.is_available():
                     logger.info("Google Drive integration enabled")
                 else:
@@ -71,8 +340,47 @@ class DocumentationCrew:
         self.model = LLMModel.GPT_4O.value
         logger.info(f"Using model: {self.model}")
 
-    def generate_documentation(self, repo: str) -> Dict:
-        """Generate documentation for a GitHub repository."""
+    @cached_property
+    def github_tool(self) -> GitHubTool:
+        """GitHub analyzer tool, only built when learning paths are generated."""
+        return get_shared_github_tool(
+            self.settings.github.api_url,
+            self.settings.github.token
+        )
+
+    @cached_property
+    def code_qa_tool(self) -> GitHubCodeQATool:
+        """Code Q&A tool, only built when code questions are asked."""
+        return GitHubCodeQATool()
+
+    def _documentation_cache_path(self, repo: str, head_sha: str, fast_mode: bool) -> Path:
+        """Return the cache file for a repository state and crew configuration."""
+        key = f"{repo}|{self.enable_google_drive}|{fast_mode}|{self.model}|{head_sha}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return Path(DOCUMENTATION_CACHE_DIR) / f"{digest}.json"
+
+    def generate_documentation(
+        self,
+        repo: str,
+        use_cache: bool = True,
+        task_callback: Optional[Callable[[str, str], None]] = None,
+        fast_mode: bool = False
+    ) -> Dict:
+        """
+        Generate documentation for a GitHub repository.
+
+        Results are cached on disk per repository HEAD commit, so re-running
+        on an unchanged repository skips the crew entirely. Entries expire after
+        DOCUMENTATION_CACHE_TTL, and nothing is cached when Google Drive is enabled.
+
+        Args:
+            repo: GitHub repository in format 'owner/repo'
+            use_cache: Whether to read and write the on-disk result cache
+            task_callback: Optional callable invoked as (stage, content) when a task
+                finishes: "fetched" with the GitHub data, "written" with the cleaned markdown
+            fast_mode: Render the learning path from the GitHub data in Python, without
+                any LLM call. Only applies when Google Drive integration is disabled.
+        """
         if not validate_github_repo(repo):
             raise ValueError(f"Invalid repository format: {repo}. Expected format: owner/repo")
 
@@ -80,6 +388,73 @@ class DocumentationCrew:
         logger.info(f"Generating learning path for repository: {repo}")
         logger.info("=" * 60)
 
+        # Fast mode has no Drive step, so it is ignored (and left out of the
+        # cache key) whenever Drive is enabled
+        fast_mode = fast_mode and not self.enable_google_drive
+
+        # Drive documents change without any version the key could name, so
+        # learning paths that draw on them are always regenerated
+        cache_path = None
+        if use_cache and not self.enable_google_drive:
+            head_sha = self.github_tool._get_head_sha(repo)
+            if head_sha:
+                cache_path = self._documentation_cache_path(repo, head_sha, fast_mode)
+                cached = _read_cached_documentation(cache_path)
+                if cached is not None:
+                    logger.info(f"Using cached learning path for {repo}@{head_sha[:7]}")
+                    return cached
+
+        if fast_mode:
+            markdown_content = self._render_fast(repo, task_callback)
+        else:
+            markdown_content, fetched = self._run_learning_path_crew(repo, task_callback)
+            if not fetched:
+                # The writer worked from an error or from no data; don't keep that for days
+                logger.warning(f"Not caching learning path for {repo}: GitHub data was not fetched")
+                cache_path = None
+
+        logger.info("Successfully generated Learning Path")
+        documentation = {
+            "repository": repo,
+            "documentation": markdown_content,
+            "format": "markdown"
+        }
+
+        if cache_path is not None:
+            try:
+                _write_cached_documentation(cache_path, documentation)
+            except OSError as e:
+                logger.warning(f"Failed to cache learning path: {e}")
+
+        return documentation
+
+    def _render_fast(self, repo: str, task_callback: Optional[Callable[[str, str], None]]) -> str:
+        """Fetch GitHub data directly and render it without the fetch and writer agents."""
+        logger.info("Fast mode: rendering learning path without LLM agents")
+        raw = self.github_tool._run(repo)
+        data = json.loads(raw)
+        if "error" in data:
+            raise RuntimeError(f"Failed to fetch repository data: {data['error']}")
+        if task_callback:
+            task_callback("fetched", raw)
+
+        markdown_content = _render_learning_path(data)
+        if task_callback:
+            task_callback("written", markdown_content)
+        return markdown_content
+
+    def _run_learning_path_crew(
+        self,
+        repo: str,
+        task_callback: Optional[Callable[[str, str], None]]
+    ) -> Tuple[str, bool]:
+        """
+        Run the fetch and writer agents.
+
+        Returns:
+            Tuple of the cleaned markdown and whether the fetch task produced
+            repository data rather than an error
+        """
         # Create GitHub analyzer agent
         github_agent = Agent(
             role="GitHub Data Fetcher",
@@ -102,39 +477,36 @@ class DocumentationCrew:
             allow_delegation=False
         )
 
+        written: Dict[str, str] = {}
+        fetched: Dict[str, bool] = {}
+
+        def on_fetched(output) -> None:
+            fetched["ok"] = _is_repository_data(output.raw)
+            # The writer reads this output as its context, so compact it in place
+            output.raw = _compact_context(output.raw)
+            if task_callback:
+                task_callback("fetched", output.raw)
+
+        def on_written(output) -> None:
+            # Clean the markdown as soon as the writer finishes, while the crew wraps up
+            written["markdown"] = extract_markdown_from_response(output.raw)
+            if task_callback:
+                task_callback("written", written["markdown"])
+
         # Create tasks
         fetch_task = Task(
-            description=f"Use the GitHub Project Analyzer tool to fetch data for repository: {repo}. Return the complete JSON response.",
-            expected_output="The JSON data from the GitHub Project Analyzer tool",
-            agent=github_agent
+            description=_FETCH_TASK_DESCRIPTION.substitute(repo=repo),
+            expected_output=_FETCH_TASK_EXPECTED_OUTPUT,
+            agent=github_agent,
+            callback=on_fetched
         )
 
         write_task = Task(
-            description="""Format the GitHub data into a Markdown learning path with these sections:
-# Learning Path: [repository name]
-
-## Overview
-- Description, URL, language, stars, forks
-
-## Recent Contributors
-- List each commit with author and message
-
-## Repository Structure
-- List the files
-
-## Code Snippets
-- Show any code snippets from the data
-
-## README
-- Show the README content
-
-## Getting Started
-- Clone command and basic setup
-
-Use ONLY data from the previous task. Do not invent anything.""",
-            expected_output="A Markdown learning path using only the provided data",
+            description=_WRITE_TASK_DESCRIPTION,
+            expected_output=_WRITE_TASK_EXPECTED_OUTPUT,
             agent=writer_agent,
-            context=[fetch_task]
+            context=[fetch_task],
+            callback=on_written
         )
 
         # Create and run crew
@@ -148,15 +520,118 @@ Use ONLY data from the previous task. Do not invent anything.""",
         logger.info("Executing crew...")
         result = crew.kickoff()
 
-        result_str = str(result)
-        markdown_content = extract_markdown_from_response(result_str)
+        markdown_content = written.get("markdown")
+        if markdown_content is None:
+            markdown_content = extract_markdown_from_response(str(result))
+        return markdown_content, fetched.get("ok", False)
 
-        logger.info("Successfully generated Learning Path")
-        return {
-            "repository": repo,
-            "documentation": markdown_content,
-            "format": "markdown"
-        }
+    def generate_documentation_stream(
+        self,
+        repo: str,
+        use_cache: bool = True,
+        fast_mode: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate documentation while yielding progress events as tasks finish.
+
+        The crew runs on a background thread. Events are dicts with a "stage" key:
+        "fetched" and "written" carry the task output in "content", and the final
+        "done" event carries the same dict generate_documentation returns.
+
+        Args:
+            repo: GitHub repository in format 'owner/repo'
+            use_cache: Whether to read and write the on-disk result cache
+            fast_mode: Skip the LLM agents, see generate_documentation
+
+        Raises:
+            Any exception raised by generate_documentation, re-raised in the caller
+        """
+        events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+        def emit(stage: str, content: str) -> None:
+            events.put({"stage": stage, "content": content})
+
+        def worker() -> None:
+            try:
+                documentation = self.generate_documentation(
+                    repo, use_cache=use_cache, task_callback=emit, fast_mode=fast_mode
+                )
+                events.put({"stage": "done", "documentation": documentation})
+            except Exception as e:
+                events.put({"stage": "error", "error": e})
+
+        threading.Thread(target=worker, name=f"crew-{repo}", daemon=True).start()
+
+        while True:
+            event = events.get()
+            if event["stage"] == "error":
+                raise event["error"]
+            yield event
+            if event["stage"] == "done":
+                return
+
+    def generate_documentation_batch(
+        self,
+        repos: List[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        rate_limit_per_minute: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """
+        Generate documentation for many repositories concurrently.
+
+        Crew runs are I/O bound on GitHub and LLM calls, so they are dispatched
+        to a bounded thread pool. A failed repository does not abort the batch.
+
+        Args:
+            repos: Repositories in format 'owner/repo'
+            max_concurrency: Maximum number of crews running at once
+            rate_limit_per_minute: Optional cap on crew starts per minute
+            on_progress: Optional callable invoked as (done, total) after each repository
+
+        Returns:
+            One result per repository, in input order. Failed repositories
+            yield {"repository": repo, "error": message}.
+        """
+        total = len(repos)
+        results: List[Optional[Dict]] = [None] * total
+        done = 0
+        progress_lock = threading.Lock()
+
+        start_interval = 60.0 / rate_limit_per_minute if rate_limit_per_minute else 0.0
+        next_start = [time.monotonic()]
+        start_lock = threading.Lock()
+
+        def wait_for_slot() -> None:
+            with start_lock:
+                now = time.monotonic()
+                delay = next_start[0] - now
+                next_start[0] = max(now, next_start[0]) + start_interval
+            if delay > 0:
+                time.sleep(delay)
+
+        def run(index: int, repo: str) -> None:
+            nonlocal done
+            if start_interval:
+                wait_for_slot()
+            try:
+                results[index] = self.generate_documentation(repo)
+            except Exception as e:
+                logger.error(f"Failed to generate learning path for {repo}: {e}")
+                results[index] = {"repository": repo, "error": str(e)}
+
+            with progress_lock:
+                done += 1
+                completed = done
+            if on_progress:
+                on_progress(completed, total)
+
+        logger.info(f"Generating learning paths for {total} repositories (concurrency={max_concurrency})")
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="crew-batch") as pool:
+            for future in [pool.submit(run, i, repo) for i, repo in enumerate(repos)]:
+                future.result()
+
+        return results
 
     def save_documentation(self, documentation: Dict, output_file: Optional[str] = None) -> str:
         """Save learning path to a Markdown file."""
@@ -167,18 +642,33 @@ Use ONLY data from the previous task. Do not invent anything.""",
 
         content = documentation.get("documentation", "")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write to a temp file in the same directory and rename, so readers never see a partial file
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=".learning_path_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.chmod(tmp_path, 0o644)  # mkstemp creates 0600 files
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
         logger.info(f"Learning path saved to {output_file}")
         return output_file
 
+    async def save_documentation_async(self, documentation: Dict, output_file: Optional[str] = None) -> str:
+        """Save learning path to a Markdown file without blocking the event loop."""
+        return await run_io(self.save_documentation, documentation, output_file)
+
     def answer_code_question(
         self,
         repo: str,
         question: str,
         directory: str = ".",
-        chat_history: Optional[List[Dict]] = None
+        chat_history: Optional[List[Dict]] = None,
+        verbose: bool = False
     ) -> Dict:
         """
         Answer a question about the repository code in a conversational way.
@@ -188,6 +678,7 @@ Use ONLY data from the previous task. Do not invent anything.""",
             question: The user's question
             directory: Directory to search for code
             chat_history: List of previous messages [{"role": "user/assistant", "content": "..."}]
+            verbose: Run through a verbose Crew instead of executing the task directly
         """
         if not validate_github_repo(repo):
             raise ValueError(f"Invalid repository format: {repo}. Expected format: owner/repo")
@@ -198,7 +689,7 @@ Use ONLY data from the previous task. Do not invent anything.""",
         logger.info(f"Directory: {directory}/")
         logger.info("=" * 60)
 
-        code_qa_tool = GitHubCodeQATool()
+        code_qa_tool = self.code_qa_tool
 
         # Build conversation context
         context_str = ""
@@ -222,34 +713,33 @@ For follow-up questions, refer to the previous conversation context.
 Be concise but helpful. Use code examples when relevant.""",
             tools=[code_qa_tool],
             llm=self.model,
-            verbose=True,
+            verbose=verbose,
             allow_delegation=False
         )
 
         qa_task = Task(
-            description=f"""You are chatting with a user about the repository: {repo}
-{context_str}
-USER'S CURRENT QUESTION: {question}
-
-Instructions:
-1. Use the GitHub Code Q&A tool to fetch code from the "{directory}" directory
-2. Answer the user's question based on the actual code
-3. If this is a follow-up question, use the conversation context
-4. Quote relevant code snippets in your answer
-5. Be conversational and helpful""",
-            expected_output="A helpful, conversational answer about the code with examples",
+            description=_QA_TASK_DESCRIPTION.substitute(
+                repo=repo,
+                context=context_str,
+                question=question,
+                directory=directory
+            ),
+            expected_output=_QA_TASK_EXPECTED_OUTPUT,
             agent=code_qa_agent
         )
 
-        crew = Crew(
-            agents=[code_qa_agent],
-            tasks=[qa_task],
-            process=Process.sequential,
-            verbose=True
-        )
-
         logger.info("Executing Code Chat agent...")
-        result = crew.kickoff()
+        if verbose:
+            crew = Crew(
+                agents=[code_qa_agent],
+                tasks=[qa_task],
+                process=Process.sequential,
+                verbose=True
+            )
+            result = crew.kickoff()
+        else:
+            # A single agent and task need none of the Crew orchestration
+            result = code_qa_agent.execute_task(qa_task)
 
         return {
             "repository": repo,
@@ -1,12 +1,18 @@
 """LLM module for custom LLM implementations"""
-from src.llm.custom_llm import (
-    OpenAILLM,
-    create_tool_calling_llm,
-    create_writing_llm
-)
+from typing import Any
 
 __all__ = [
     "OpenAILLM",
+    "create_llm",
     "create_tool_calling_llm",
-    "create_writing_llm"
+    "create_writing_llm",
+    "shutdown_clients"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the LLM implementation (and the OpenAI SDK) on first use."""
+    if name in __all__:
+        from src.llm import custom_llm
+        return getattr(custom_llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,54 @@
 """Custom LLM implementation using OpenAI API"""
-from typing import Any, List, Optional, Union, Dict
-from openai import OpenAI
+import os
+import threading
+from typing import Any, Iterator, List, Optional, Tuple, Union, Dict
+from openai import AsyncOpenAI, OpenAI
 from crewai.llm import BaseLLM
 
+from src.config.constants import (
+    DEFAULT_LLM_MAX_RETRIES,
+    DEFAULT_MAX_TOKENS_TOOL_CALLING,
+    DEFAULT_TEMPERATURE_TOOL_CALLING,
+    DEFAULT_TEMPERATURE_WRITING
+)
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Context window sizes by model family. Matched anywhere in the model name so
+# provider-qualified names such as openai/gpt-4o resolve; the longest match wins
+_CONTEXT_WINDOWS: Dict[str, int] = {
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-3.5-turbo": 16385,
+}
+_DEFAULT_CONTEXT_WINDOW = 8192
+
+# OpenAI clients shared by every LLM with the same connection settings
+_clients: Dict[Tuple[str, int, int], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(api_key: str, timeout: int, max_retries: int) -> OpenAI:
+    """Return the shared OpenAI client, and its connection pool, for these settings."""
+    key = (api_key, timeout, max_retries)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OpenAI(api_key=api_key, timeout=timeout, max_retries=max_retries)
+            _clients[key] = client
+    return client
+
+
+def shutdown_clients() -> None:
+    """Close every shared OpenAI client, e.g. at process shutdown or between tests."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
 
 class OpenAILLM(BaseLLM):
     """
@@ -22,7 +64,8 @@ class OpenAILLM(BaseLLM):
         temperature: float = 0.6,
         max_tokens: Optional[int] = None,
         timeout: int = 300,
-        supports_tools: bool = False
+        supports_tools: bool = False,
+        max_retries: int = DEFAULT_LLM_MAX_RETRIES
     ):
         """
         Initialize the OpenAI LLM.
@@ -31,19 +74,28 @@ class OpenAILLM(BaseLLM):
             model: The model name to use (e.g., gpt-4o, gpt-4o-mini)
             api_key: OpenAI API key
             temperature: Sampling temperature (0.0-1.0)
-            max_tokens: Maximum tokens to generate
+            max_tokens: Maximum tokens to generate (None leaves the completion uncapped)
             timeout: Request timeout in seconds
             supports_tools: Whether this model supports function/tool calling
+            max_retries: Retries on timeouts, connection errors, 429 and 5xx. The SDK
+                backs off exponentially with jitter and honors Retry-After.
         """
         super().__init__(model=model, temperature=temperature)
 
         self.api_key = api_key
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.max_retries = max_retries
         self._supports_tools = supports_tools
+        family = max((name for name in _CONTEXT_WINDOWS if name in model), key=len, default=None)
+        self._context_window = _CONTEXT_WINDOWS[family] if family else _DEFAULT_CONTEXT_WINDOW
+
+        # Request parameters that never change between calls
+        self._base_params: Dict[str, Any] = {"model": model}
 
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=api_key, timeout=timeout)
+        # Tool calling and writing LLMs share one client, so they reuse its connections
+        self.client = _get_client(api_key, timeout, max_retries)
+        self._aclient: Optional[AsyncOpenAI] = None
 
         logger.info(
             f"Initialized OpenAILLM: model={model}, supports_tools={supports_tools}"
@@ -69,34 +121,140 @@ class OpenAILLM(BaseLLM):
         Raises:
             RuntimeError: If the API call fails
         """
+        params = self._build_params(messages, kwargs)
+
+        try:
+            logger.debug(f"Calling OpenAI API with model: {self.model}")
+            response = self.client.chat.completions.create(**params)
+
+            content = response.choices[0].message.content
+
+            logger.debug(f"OpenAI response received: {len(content)} characters")
+            self._log_usage(response)
+            return content
+
+        except Exception as e:
+            error_msg = f"Error calling OpenAI API: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def stream_call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream a completion from the OpenAI API as text deltas.
+
+        Lets callers show output as soon as the first token arrives instead of
+        waiting for the whole completion. Join the deltas to get what call returns.
+
+        Args:
+            messages: Either a string or list of message dicts with role/content
+            **kwargs: Additional parameters
+
+        Yields:
+            Text deltas in the order they are generated
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        params = self._build_params(messages, kwargs)
+        params["stream"] = True
+
+        try:
+            logger.debug(f"Streaming OpenAI API response with model: {self.model}")
+            for chunk in self.client.chat.completions.create(**params):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            error_msg = f"Error calling OpenAI API: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def _build_params(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters shared by call and acall."""
         # Convert string to messages format if needed
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
 
         # Prepare the parameters
         params = {
-            "model": self.model,
+            **self._base_params,
             "messages": messages,
             "temperature": kwargs.get("temperature", self.temperature),
         }
 
-        # Add optional parameters
-        if self.max_tokens:
-            params["max_tokens"] = self.max_tokens
+        # Add optional parameters; a per-call max_tokens overrides the LLM's own
+        max_tokens = kwargs.get("max_tokens")
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+
+        stop = kwargs.get("stop")
+        if stop is not None:
+            params["stop"] = stop
+
+        return params
+
+    def _log_usage(self, response: Any) -> None:
+        """Log token usage reported by the API at debug level."""
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            logger.debug(
+                f"OpenAI token usage: prompt={usage.prompt_tokens}, "
+                f"completion={usage.completion_tokens}, total={usage.total_tokens}"
+            )
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async OpenAI client, created on first async call."""
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI(
+                api_key=self.api_key,
+                timeout=self.timeout,
+                max_retries=self.max_retries
+            )
+        return self._aclient
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        callbacks: Optional[Any] = None,
+        **kwargs
+    ) -> str:
+        """
+        Make a non-blocking call to the OpenAI API.
 
-        if "max_tokens" in kwargs:
-            params["max_tokens"] = kwargs["max_tokens"]
+        Lets several agent turns run concurrently on one event loop.
 
-        if "stop" in kwargs:
-            params["stop"] = kwargs["stop"]
+        Args:
+            messages: Either a string or list of message dicts with role/content
+            callbacks: Optional callbacks (not used)
+            **kwargs: Additional parameters
+
+        Returns:
+            The generated text response
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        params = self._build_params(messages, kwargs)
 
         try:
-            logger.debug(f"Calling OpenAI API with model: {self.model}")
-            response = self.client.chat.completions.create(**params)
+            logger.debug(f"Calling OpenAI API asynchronously with model: {self.model}")
+            response = await self.aclient.chat.completions.create(**params)
 
             content = response.choices[0].message.content
 
             logger.debug(f"OpenAI response received: {len(content)} characters")
+            self._log_usage(response)
             return content
 
         except Exception as e:
@@ -104,6 +262,28 @@ class OpenAILLM(BaseLLM):
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def aclose(self) -> None:
+        """
+        Close this LLM's async client and its connection pool.
+
+        Await this from the event loop that made the acall requests once the
+        LLM is no longer needed. The sync client is shared with other LLMs and
+        stays open until shutdown_clients() is called.
+        """
+        aclient, self._aclient = self._aclient, None
+        if aclient is not None:
+            await aclient.close()
+
+    def close(self) -> None:
+        """
+        Forget this LLM's async client without closing it.
+
+        An async client can only be closed from an event loop, so its
+        connections are released when it is garbage collected; use aclose()
+        to close them promptly. The shared sync client is left open.
+        """
+        self._aclient = None
+
     def supports_function_calling(self) -> bool:
         """Indicate whether this LLM supports function/tool calling."""
         return self._supports_tools
@@ -114,32 +294,69 @@ class OpenAILLM(BaseLLM):
 
     def get_context_window_size(self) -> int:
         """Return the context window size for this model."""
-        # GPT-4o and GPT-4o-mini have 128k context window
-        if "gpt-4o" in self.model:
-            return 128000
-        return 8192
+        return self._context_window
 
 
-def create_tool_calling_llm(api_key: str, model: str, temperature: float = 0.3) -> OpenAILLM:
+# mode -> (temperature, max_tokens, supports_tools). Only tool calling turns are
+# capped; a writer cut off at a token limit would return a truncated learning path
+_LLM_PROFILES: Dict[str, Tuple[float, Optional[int], bool]] = {
+    "tool_calling": (DEFAULT_TEMPERATURE_TOOL_CALLING, DEFAULT_MAX_TOKENS_TOOL_CALLING, True),
+    "writing": (DEFAULT_TEMPERATURE_WRITING, None, False),
+}
+
+
+def create_llm(
+    api_key: str,
+    model: str,
+    mode: str = "writing",
+    temperature: Optional[float] = None,
+    max_retries: Optional[int] = None
+) -> OpenAILLM:
     """
-    Factory function to create an LLM instance configured for tool calling.
+    Factory function to create an LLM instance for a given usage profile.
 
     Args:
         api_key: OpenAI API key
         model: Model name
-        temperature: Temperature (default: 0.3 for deterministic tool calling)
+        mode: "tool_calling" or "writing"
+        temperature: Override for the profile's default temperature
+        max_retries: Retry budget for API calls (defaults to the LLM_MAX_RETRIES environment variable)
 
     Returns:
         Configured OpenAILLM instance
+
+    Raises:
+        ValueError: If mode is not a known profile
     """
+    if mode not in _LLM_PROFILES:
+        raise ValueError(f"Unknown LLM mode: {mode}. Expected one of: {', '.join(_LLM_PROFILES)}")
+
+    default_temperature, max_tokens, supports_tools = _LLM_PROFILES[mode]
     return OpenAILLM(
         model=model,
         api_key=api_key,
-        temperature=temperature,
-        supports_tools=True
+        temperature=default_temperature if temperature is None else temperature,
+        max_tokens=max_tokens,
+        supports_tools=supports_tools,
+        max_retries=int(os.getenv("LLM_MAX_RETRIES", DEFAULT_LLM_MAX_RETRIES)) if max_retries is None else max_retries
     )
 
 
+def create_tool_calling_llm(api_key: str, model: str, temperature: float = 0.3) -> OpenAILLM:
+    """
+    Factory function to create an LLM instance configured for tool calling.
+
+    Args:
+        api_key: OpenAI API key
+        model: Model name
+        temperature: Temperature (default: 0.3 for deterministic tool calling)
+
+    Returns:
+        Configured OpenAILLM instance
+    """
+    return create_llm(api_key, model, mode="tool_calling", temperature=temperature)
+
+
 def create_writing_llm(api_key: str, model: str, temperature: float = 0.6) -> OpenAILLM:
     """
     Factory function to create an LLM instance configured for content writing.
@@ -152,9 +369,4 @@ def create_writing_llm(api_key: str, model: str, temperature: float = 0.6) -> Op
     Returns:
         Configured OpenAILLM instance
     """
-    return OpenAILLM(
-        model=model,
-        api_key=api_key,
-        temperature=temperature,
-        supports_tools=False
-    )
+    return create_llm(api_key, model, mode="writing", temperature=temperature)
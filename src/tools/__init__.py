@@ -1,10 +1,11 @@
 """Tools module for CrewAI agents"""
-from src.tools.github_tool import GitHubTool
+from src.tools.github_tool import GitHubTool, get_shared_github_tool
 from src.tools.google_drive_tool import GoogleDriveMCPTool
 from src.tools.github_code_qa_tool import GitHubCodeQATool
 
 __all__ = [
     "GitHubTool",
     "GoogleDriveMCPTool",
-    "GitHubCodeQATool"
+    "GitHubCodeQATool",
+    "get_shared_github_tool"
 ]
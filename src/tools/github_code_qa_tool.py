@@ -1,20 +1,68 @@
 """GitHub Code Q&A Tool - Deep dives into repository code to answer questions"""
-import json
-from typing import Type, Dict, Any
+from typing import Type, Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from src.config.constants import (
+    BRANCH_SHA_TTL,
+    DEFAULT_BRANCH_TTL,
+    QA_CODE_CACHE_SIZE,
+    QA_CODE_CACHE_TTL,
+    QA_MAX_CHARS_PER_FILE,
+    QA_MAX_TOTAL_CHARS
+)
 from src.config.settings import get_settings
+from src.utils.cache import TTLCache
 from src.utils.logger import setup_logger
+from src.utils.serialization import to_compact_json
 
 logger = setup_logger(__name__)
 
+# Default branches rarely change; branch heads move, so their SHAs expire quickly;
+# code fetched at a SHA never changes. All three are keyed by (api_url, token) too
+_default_branches = TTLCache(maxsize=QA_CODE_CACHE_SIZE, ttl=DEFAULT_BRANCH_TTL)
+_head_shas = TTLCache(maxsize=QA_CODE_CACHE_SIZE, ttl=BRANCH_SHA_TTL)
+_code_files = TTLCache(maxsize=QA_CODE_CACHE_SIZE, ttl=QA_CODE_CACHE_TTL)
+
+
+def _apply_content_budget(files: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Truncate file contents to the per-file and total character budgets.
+
+    Args:
+        files: File entries with a "content" field
+
+    Returns:
+        Tuple of (entries that fit the total budget, number of entries dropped)
+    """
+    kept = []
+    total = 0
+    for index, entry in enumerate(files):
+        if total >= QA_MAX_TOTAL_CHARS:
+            return kept, len(files) - index
+
+        content = entry.get("content") or ""
+        limit = min(QA_MAX_CHARS_PER_FILE, QA_MAX_TOTAL_CHARS - total)
+        if len(content) > limit:
+            # Copy so the fetched entry itself is left untouched
+            entry = dict(entry, content=content[:limit] + "\n... [truncated]")
+            content = content[:limit]
+
+        kept.append(entry)
+        total += len(content)
+
+    return kept, 0
+
 
 class GitHubCodeQAToolSchema(BaseModel):
     """Input schema for GitHubCodeQATool."""
     repo: str = Field(..., description="Repository in format 'owner/repo'")
     question: str = Field(..., description="Question about the codebase")
     directory: str = Field(default="src", description="Directory to search (default: src)")
+    questions: Optional[List[str]] = Field(
+        default=None,
+        description="Optional follow-up questions about the same directory, answered from one fetch"
+    )
 
 
 class GitHubCodeQATool(BaseTool):
@@ -33,6 +81,7 @@ class GitHubCodeQATool(BaseTool):
         "DO NOT use this tool for learning path generation - use 'GitHub Project Analyzer' instead. "
         "ONLY use this when a user asks a specific question like 'What feature processing does this do?' "
         "Input requires: repo path, question, and optional directory (default: src, use '.' for root). "
+        "Pass related follow-up questions in 'questions' to answer them all from one code fetch. "
         "Returns: code files with full content and links for answering the specific question asked."
     )
     args_schema: Type[BaseModel] = GitHubCodeQAToolSchema
@@ -47,14 +96,20 @@ class GitHubCodeQATool(BaseTool):
         object.__setattr__(self, 'api_url', settings.github.api_url.rstrip('/'))
         object.__setattr__(self, 'token', settings.github.token)
 
-        # Import GitHubTool to reuse the code fetching method
-        from src.tools.github_tool import GitHubTool
-        github_tool = GitHubTool()
+        # Reuse the shared GitHubTool (and its pooled session) for code fetching
+        from src.tools.github_tool import get_shared_github_tool
+        github_tool = get_shared_github_tool(settings.github.api_url, settings.github.token)
         object.__setattr__(self, '_github_tool', github_tool)
 
         logger.info("Initialized GitHubCodeQATool")
 
-    def _run(self, repo: str, question: str, directory: str = "src") -> str:
+    def _run(
+        self,
+        repo: str,
+        question: str,
+        directory: str = "src",
+        questions: Optional[List[str]] = None
+    ) -> str:
         """
         Fetch code files and provide context for answering the question.
 
@@ -62,6 +117,7 @@ class GitHubCodeQATool(BaseTool):
             repo: Repository in format 'owner/repo'
             question: Question about the codebase
             directory: Directory to search (default: src)
+            questions: Optional follow-up questions answered from the same files
 
         Returns:
             JSON string with code files and their contents
@@ -70,73 +126,94 @@ class GitHubCodeQATool(BaseTool):
         logger.info("GITHUB CODE Q&A TOOL CALLED")
         logger.info(f"Repository: {repo}")
         logger.info(f"Question: {question}")
+        if questions:
+            logger.info(f"Follow-up questions: {len(questions)}")
         logger.info(f"Directory: {directory}")
         logger.info("=" * 80)
 
         try:
-            # Get repo info to find default branch
+            # Every cache is keyed by credentials: a private repository's branch,
+            # head commit and code must only reach callers whose own token was
+            # used to look them up
             github_tool = getattr(self, '_github_tool')
-            repo_info = github_tool._get_repo_info(repo)
-
-            if "error" in repo_info:
-                return json.dumps({"error": repo_info["error"]})
-
-            branch = repo_info.get("default_branch", "main")
-
-            # Fetch code files from directory
-            logger.info(f"Fetching code files from {directory}/ on branch {branch}")
-            code_data = github_tool._get_code_files_from_directory(
-                repo=repo,
-                branch=branch,
-                directory=directory,
-                max_files=10
-            )
+            credentials = (self.api_url, self.token)
+
+            # Get repo info to find default branch, unless it was looked up recently
+            branch = _default_branches.get((credentials, repo))
+            if branch is None:
+                repo_info = github_tool._get_repo_info(repo)
+
+                if "error" in repo_info:
+                    return to_compact_json({"error": repo_info["error"]})
+
+                branch = repo_info.get("default_branch", "main")
+                _default_branches.set((credentials, repo), branch)
+
+            # Reuse code already fetched at the branch's current head commit
+            head_sha = _head_shas.get((credentials, repo, branch))
+            if head_sha is None:
+                head_sha = github_tool._get_head_sha(repo, ref=branch)
+                if head_sha:
+                    _head_shas.set((credentials, repo, branch), head_sha)
+            cache_key = (credentials, repo, head_sha, directory) if head_sha else None
+            code_data = _code_files.get(cache_key) if cache_key else None
+
+            if code_data is not None:
+                logger.info(f"Using cached code files from {directory}/ at {head_sha[:7]}")
+            else:
+                # Fetch code files from directory
+                logger.info(f"Fetching code files from {directory}/ on branch {branch}")
+                code_data = github_tool._get_code_files_from_directory(
+                    repo=repo,
+                    branch=branch,
+                    directory=directory,
+                    max_files=10
+                )
+                if cache_key and "files" in code_data:
+                    _code_files.set(cache_key, code_data)
 
             if "error" in code_data:
                 logger.error(f"Failed to fetch code files: {code_data['error']}")
-                return json.dumps({
+                return to_compact_json({
                     "error": code_data["error"],
                     "question": question
                 })
 
             if "message" in code_data:
                 logger.warning(f"No files found: {code_data['message']}")
-                return json.dumps({
+                return to_compact_json({
                     "message": code_data["message"],
                     "question": question,
                     "suggestion": f"Try a different directory or check if {directory}/ exists in the repository"
                 })
 
-            # Prepare result
+            # File entries already carry name, path, link, content and lines,
+            # so reference them directly instead of copying each one
+            files, dropped = _apply_content_budget(list(code_data.get("files", {}).values()))
             result = {
                 "repository": repo,
                 "question": question,
                 "directory": directory,
                 "branch": branch,
                 "files_count": code_data.get("files_count", 0),
-                "files": []
+                "files": files
             }
-
-            # Format files for easier consumption
-            files_dict = code_data.get("files", {})
-            for file_path, file_data in files_dict.items():
-                result["files"].append({
-                    "name": file_data.get("name"),
-                    "path": file_data.get("path"),
-                    "link": file_data.get("link"),
-                    "content": file_data.get("content"),
-                    "lines": file_data.get("lines")
-                })
+            if questions:
+                result["questions"] = [question] + [q for q in questions if q != question]
+            if dropped:
+                result["truncation_note"] = (
+                    f"{dropped} more file(s) omitted to stay within {QA_MAX_TOTAL_CHARS} characters"
+                )
 
             logger.info(f"Successfully fetched {len(result['files'])} code files")
             logger.info("Agent should now analyze these files to answer the question")
 
-            return json.dumps(result, indent=2)
+            return to_compact_json(result)
 
         except Exception as e:
             error_msg = f"Error in Code Q&A tool: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return json.dumps({
+            return to_compact_json({
                 "error": error_msg,
                 "question": question
             })
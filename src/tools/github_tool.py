@@ -1,18 +1,170 @@
 """GitHub Tool for CrewAI - Fetches project information from GitHub"""
-import json
+import codecs
+import threading
+import time
 import requests
-import base64
-from typing import Any, Dict, List, Type
+from collections import deque
+from functools import lru_cache
+from os.path import splitext
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from src.config.constants import (
+    GITHUB_ETAG_CACHE_SIZE,
+    GITHUB_ETAG_CACHE_TTL,
+    GITHUB_FETCH_CONCURRENCY,
+    GITHUB_OVERVIEW_CACHE_SIZE,
+    GITHUB_OVERVIEW_CACHE_TTL,
+    GITHUB_RATE_LIMIT_MAX_WAIT,
+    GITHUB_RATE_LIMIT_RESERVE,
+    GITHUB_REQUEST_TIMEOUT,
+    ROOT_LISTING_LIMIT
+)
 from src.config.settings import get_settings
+from src.utils.cache import TTLCache
+from src.utils.concurrency import map_io, run_io, submit_io
+from src.utils.http import get_http_session
 from src.utils.logger import setup_logger
+from src.utils.serialization import to_compact_json
 from src.utils.validators import validate_github_repo
 
 logger = setup_logger(__name__)
 
 
+# Supported code file extensions
+_CODE_EXTENSIONS = frozenset((
+    '.py', '.js', '.ts', '.jsx', '.tsx',  # Python, JavaScript, TypeScript
+    '.java', '.kt', '.scala',              # JVM languages
+    '.go', '.rs', '.rb',                   # Go, Rust, Ruby
+    '.php', '.c', '.cpp', '.h', '.hpp',    # PHP, C/C++
+    '.cs', '.swift', '.m',                 # C#, Swift, Objective-C
+    '.sql', '.sh', '.bash',                # SQL, Shell
+    '.yaml', '.yml', '.json', '.toml',     # Config files
+    '.md', '.rst', '.txt',                 # Documentation
+    '.html', '.css', '.scss',              # Web files
+))
+
+# Key files to fetch code snippets from (in priority order)
+_KEY_FILES = (
+    'main.py',
+    'app.py',
+    '__init__.py',
+    'setup.py',
+    'requirements.txt',
+    'Dockerfile',
+    'docker-compose.yml',
+    'config.py',
+    'settings.py',
+    'package.json',
+    'index.js',
+    'index.ts'
+)
+
+# Fields copied as-is from the REST repository payload
+_REPO_INFO_FIELDS = (
+    "id", "name", "full_name", "description", "default_branch",
+    "stargazers_count", "forks_count", "open_issues_count",
+    "created_at", "updated_at", "pushed_at", "html_url", "language"
+)
+
+_KEY_FILE_PRIORITY = {name: rank for rank, name in enumerate(_KEY_FILES)}
+
+
+def _code_file_priority(item: Dict[str, Any]) -> Tuple[int, bool, int]:
+    """Sort key ranking git tree blobs for code Q&A fetches."""
+    size = item.get('size') or 0
+    name = item.get('path', '').rsplit('/', 1)[-1]
+    return _KEY_FILE_PRIORITY.get(name, len(_KEY_FILE_PRIORITY)), size == 0, size
+
+
+# README names probed by the GraphQL overview; any other README is found with REST /readme
+_README_FILES = ('README.md', 'README.rst', 'README.txt', 'README', 'readme.md')
+
+# Repository overview in one GraphQL query; blob fields for key files are appended
+_OVERVIEW_QUERY = """
+query($owner: String!, $name: String!, $commits: Int!$blob_declarations) {
+  repository(owner: $owner, name: $name) {
+    databaseId name nameWithOwner description url isPrivate
+    stargazerCount forkCount createdAt updatedAt pushedAt
+    primaryLanguage { name }
+    licenseInfo { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      name
+      target { ... on Commit { history(first: $commits) { nodes { oid messageHeadline url author { name date } } } } }
+    }
+    tree: object(expression: "HEAD:") { ... on Tree { entries { name path type object { ... on Blob { byteSize } } } } }
+    $blob_fields
+  }
+}
+"""
+
+_TREE_ENTRY_TYPES = {"blob": "file", "tree": "dir", "commit": "submodule"}
+
+
+def _blob_query_parts(expressions: List[str]) -> Tuple[str, str, Dict[str, str]]:
+    """Build GraphQL variable declarations, aliased blob fields and variables for file expressions."""
+    declarations = "".join(f", $e{i}: String!" for i in range(len(expressions)))
+    fields = " ".join(
+        f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text }} }}"
+        for i in range(len(expressions))
+    )
+    variables = {f"e{i}": expression for i, expression in enumerate(expressions)}
+    return declarations, fields, variables
+
+
+class _RateLimiter:
+    """
+    Tracks GitHub's rate limit headers and pauses requests when the budget runs low.
+
+    Turns the hard 403 at the end of the hourly quota into a wait for the reset,
+    capped so an agent is never blocked for long.
+    """
+
+    def __init__(self, reserve: int = GITHUB_RATE_LIMIT_RESERVE, max_wait: float = GITHUB_RATE_LIMIT_MAX_WAIT):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Sleep until the quota resets if fewer than reserve requests remain."""
+        with self._lock:
+            if self.remaining is None or self.remaining >= self.reserve:
+                return
+            delay = self.reset_at - time.time()
+
+        if delay > 0:
+            delay = min(delay, self.max_wait)
+            logger.warning(f"GitHub rate limit nearly exhausted ({self.remaining} left), waiting {delay:.0f}s")
+            time.sleep(delay)
+
+    def update(self, response: requests.Response) -> None:
+        """Record the quota reported by a response."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self.remaining = int(remaining)
+            self.reset_at = float(reset)
+
+    def retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, if it should be retried."""
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None or not retry_after.isdigit():
+            return None
+        delay = float(retry_after)
+        return delay if delay <= self.max_wait else None
+
+
 class GitHubToolSchema(BaseModel):
     """Input schema for GitHubTool."""
     repo: str = Field(..., description="Repository in format 'owner/repo'")
@@ -39,22 +191,49 @@ class GitHubTool(BaseTool):
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, **kwargs):
-        """Initialize GitHub tool with configuration."""
+    def __init__(self, api_url: str = None, token: str = None, **kwargs):
+        """
+        Initialize GitHub tool with configuration.
+
+        Args:
+            api_url: GitHub API URL (optional, reads from settings if not provided)
+            token: GitHub token (optional, reads from settings if not provided)
+        """
         super().__init__(**kwargs)
-        settings = get_settings()
-        object.__setattr__(self, 'api_url', settings.github.api_url.rstrip('/'))
-        object.__setattr__(self, 'token', settings.github.token)
+        # Settings are global and reloaded per user, so read them only as a fallback
+        if api_url is None or token is None:
+            settings = get_settings()
+            api_url = api_url or settings.github.api_url
+            token = token or settings.github.token
+        object.__setattr__(self, 'api_url', api_url.rstrip('/'))
+        object.__setattr__(self, 'token', token)
         object.__setattr__(self, 'headers', {
-            'Authorization': f'Bearer {settings.github.token}',
+            'Authorization': f'Bearer {token}',
             'Accept': 'application/vnd.github.v3+json',
             'X-GitHub-Api-Version': '2022-11-28'
         })
-        logger.info(f"Initialized GitHubTool with API URL: {settings.github.api_url}")
+        # Contents requests ask for the raw file body instead of base64-encoded JSON
+        object.__setattr__(self, 'raw_headers', dict(
+            self.headers,
+            Accept='application/vnd.github.raw'
+        ))
+        # GitHub Enterprise serves GraphQL at /api/graphql next to /api/v3
+        api_url = self.api_url
+        graphql_url = f"{api_url[:-3]}graphql" if api_url.endswith('/v3') else f"{api_url}/graphql"
+        object.__setattr__(self, 'graphql_url', graphql_url)
+        object.__setattr__(self, 'session', get_http_session())
+        object.__setattr__(self, '_etag_cache', TTLCache(maxsize=GITHUB_ETAG_CACHE_SIZE, ttl=GITHUB_ETAG_CACHE_TTL))
+        object.__setattr__(self, '_rate_limiter', _RateLimiter())
+        # GraphQL has its own hourly quota, reported in the same headers
+        object.__setattr__(self, '_graphql_rate_limiter', _RateLimiter())
+        # Agents often call the analyzer repeatedly for one repository; results
+        # are keyed by HEAD commit and expire so metadata such as stars refreshes
+        object.__setattr__(self, '_overview_cache', TTLCache(maxsize=GITHUB_OVERVIEW_CACHE_SIZE, ttl=GITHUB_OVERVIEW_CACHE_TTL))
+        logger.info(f"Initialized GitHubTool with API URL: {self.api_url}")
 
     def _run(self, repo: str) -> str:
         """
-        Fetch repository information using GitHub REST API.
+        Fetch repository information using the GitHub GraphQL API, or REST as a fallback.
 
         Args:
             repo: Repository in format 'owner/repo'
@@ -70,29 +249,54 @@ class GitHubTool(BaseTool):
         if not validate_github_repo(repo):
             error_msg = f"Invalid repository format: {repo}. Expected format: owner/repo"
             logger.error(error_msg)
-            return json.dumps({"error": error_msg})
+            return to_compact_json({"error": error_msg})
 
         try:
+            # Cached results are keyed by the HEAD commit, so a push is never
+            # answered with files, README or commits from before it. Resolving
+            # HEAD is a single request, revalidated with its ETag after the first
+            head_sha = self._get_head_sha(repo)
+            cache_key = (repo, head_sha) if head_sha else None
+            cached = self._overview_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                logger.info(f"Using cached data for repository: {repo}@{head_sha[:7]}")
+                return to_compact_json({"repository": repo, **cached})
+
             logger.info(f"Fetching GitHub repository information: {repo}")
 
+            # One GraphQL round trip covers everything below; use REST if it fails
+            overview = self._get_repository_overview(repo)
+            if overview is not None:
+                self._cache_overview(cache_key, overview)
+                logger.info(f"Successfully fetched data for repository: {repo}")
+                return to_compact_json({"repository": repo, **overview})
+
+            # Only code snippets depend on the repository info (for the default
+            # branch), so start the other fetches before it and run them alongside
+            file_structure_future = submit_io(self._get_file_structure, repo)
+            commits_future = submit_io(self._get_recent_commits, repo, limit=5)
+            readme_future = submit_io(self._get_readme, repo)
+
             # Get repository information
             repo_info = self._get_repo_info(repo)
 
             if "error" in repo_info:
                 logger.error(f"Failed to fetch repo info: {repo_info['error']}")
-                return json.dumps({"error": repo_info["error"]})
-
-            # Get file structure
-            file_structure = self._get_file_structure(repo)
+                for future in (file_structure_future, commits_future, readme_future):
+                    future.cancel()
+                return to_compact_json({"error": repo_info["error"]})
 
-            # Get recent commits
-            commits = self._get_recent_commits(repo, limit=5)
-
-            # Get README
-            readme = self._get_readme(repo)
+            # The root listing tells which key files exist, unless it was cut short
+            file_structure = file_structure_future.result()
+            root_files = file_structure.get("files")
+            if root_files is not None and len(root_files) >= ROOT_LISTING_LIMIT:
+                root_files = None
 
             # Get code snippets from key files
-            code_snippets = self._get_code_snippets(repo, repo_info.get("default_branch", "main"))
+            code_snippets = self._get_code_snippets(repo, repo_info.get("default_branch", "main"), root_files)
+
+            commits = commits_future.result()
+            readme = readme_future.result()
 
             result = {
                 "repository": repo,
@@ -102,14 +306,132 @@ class GitHubTool(BaseTool):
                 "readme": readme,
                 "code_snippets": code_snippets
             }
+            self._cache_overview(cache_key, result)
 
             logger.info(f"Successfully fetched data for repository: {repo}")
-            return json.dumps(result, indent=2)
+            return to_compact_json(result)
 
         except Exception as e:
             error_msg = f"Error fetching GitHub repository data: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return json.dumps({"error": error_msg})
+            return to_compact_json({"error": error_msg})
+
+    async def arun(self, repo: str) -> str:
+        """Async variant of _run that performs the blocking fetch on the shared I/O pool."""
+        return await run_io(self._run, repo)
+
+    def _cache_overview(self, cache_key: Optional[Tuple[str, str]], result: Dict[str, Any]) -> None:
+        """
+        Remember a repository's analyzer result for its HEAD commit.
+
+        Nothing is stored when HEAD could not be resolved, when any part of the
+        result failed, or when a push landed between resolving HEAD and fetching
+        (the newest commit in the result is not the one the key names).
+        """
+        if cache_key is None:
+            return
+
+        commits = result["recent_commits"]
+        if any("error" in part for part in (result["file_structure"], result["code_snippets"])):
+            return
+        if any("error" in commit for commit in commits) or result["readme"].startswith("Error fetching README"):
+            return
+        if commits and commits[0].get("sha") != cache_key[1][:7]:
+            return
+
+        self._overview_cache.set(cache_key, {key: value for key, value in result.items() if key != "repository"})
+
+    def clear_cache(self) -> None:
+        """Forget every cached GitHub response so the next call goes to the API."""
+        self._overview_cache.clear()
+        self._etag_cache.clear()
+
+    def _conditional_get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Union[float, Tuple[float, float]] = GITHUB_REQUEST_TIMEOUT
+    ) -> requests.Response:
+        """
+        GET a URL, revalidating any earlier response with its ETag.
+
+        GitHub answers If-None-Match with 304 Not Modified when nothing changed,
+        which is cheap and does not count against the rate limit; the stored
+        response is then returned in its place. Requests also pause when the
+        rate limit is nearly exhausted and honor Retry-After once.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            params: Optional query parameters
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+
+        Returns:
+            The fresh response, or the stored one if GitHub reported no change
+        """
+        etag_cache = self._etag_cache
+        key = (url, tuple(sorted((params or {}).items())), headers.get('Accept'))
+        cached = etag_cache.get(key)
+
+        request_headers = headers
+        if cached is not None:
+            request_headers = dict(headers, **{'If-None-Match': cached.headers['ETag']})
+
+        rate_limiter = self._rate_limiter
+        rate_limiter.wait()
+        response = self.session.get(url, headers=request_headers, params=params, timeout=timeout)
+        rate_limiter.update(response)
+
+        # Secondary rate limits answer 403 with Retry-After; wait once and retry
+        delay = rate_limiter.retry_after(response)
+        if delay is not None:
+            logger.warning(f"GitHub asked to retry after {delay:.0f}s: {url}")
+            time.sleep(delay)
+            response = self.session.get(url, headers=request_headers, params=params, timeout=timeout)
+            rate_limiter.update(response)
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Not modified, reusing cached response: {url}")
+            return cached
+        if response.status_code == 200 and response.headers.get('ETag'):
+            etag_cache.set(key, response)
+        return response
+
+    def _get_raw_head(
+        self,
+        url: str,
+        max_bytes: int,
+        timeout: Union[float, Tuple[float, float]] = GITHUB_REQUEST_TIMEOUT
+    ) -> Tuple[int, bytes]:
+        """
+        GET a raw file body, reading at most max_bytes of it.
+
+        The body is streamed and the connection closed once enough has been
+        read, so a huge file costs no more than its first few kilobytes.
+
+        Args:
+            url: Request URL
+            max_bytes: Maximum number of (decompressed) body bytes to read
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+
+        Returns:
+            Tuple of HTTP status code and the start of the body
+        """
+        rate_limiter = self._rate_limiter
+        rate_limiter.wait()
+        with self.session.get(url, headers=self.raw_headers, timeout=timeout, stream=True) as response:
+            rate_limiter.update(response)
+            if response.status_code != 200:
+                return response.status_code, b""
+            # iter_content decompresses the same way under urllib3 1.x and 2.x;
+            # compressed chunks can inflate past the chunk size, hence the trim
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=max_bytes):
+                body += chunk
+                if len(body) >= max_bytes:
+                    break
+            return response.status_code, bytes(body[:max_bytes])
 
     def _get_repo_info(self, repo: str) -> Dict[str, Any]:
         """
@@ -122,33 +444,20 @@ class GitHubTool(BaseTool):
             Dictionary with repository information
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
+            api_url = self.api_url
+            headers = self.headers
             url = f'{api_url}/repos/{repo}'
 
             logger.debug(f"Fetching repo info from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._conditional_get(url, headers=headers)
 
             if response.status_code == 200:
                 data = response.json()
-                return {
-                    "id": data.get("id"),
-                    "name": data.get("name"),
-                    "full_name": data.get("full_name"),
-                    "description": data.get("description"),
-                    "default_branch": data.get("default_branch"),
-                    "visibility": "private" if data.get("private") else "public",
-                    "stargazers_count": data.get("stargazers_count"),
-                    "forks_count": data.get("forks_count"),
-                    "open_issues_count": data.get("open_issues_count"),
-                    "topics": data.get("topics", []),
-                    "created_at": data.get("created_at"),
-                    "updated_at": data.get("updated_at"),
-                    "pushed_at": data.get("pushed_at"),
-                    "html_url": data.get("html_url"),
-                    "language": data.get("language"),
-                    "license": data.get("license", {}).get("name") if data.get("license") else None
-                }
+                info = {field: data.get(field) for field in _REPO_INFO_FIELDS}
+                info["visibility"] = "private" if data.get("private") else "public"
+                info["topics"] = data.get("topics", [])
+                info["license"] = data["license"].get("name") if data.get("license") else None
+                return info
             else:
                 error_msg = f"Failed to fetch repo info: HTTP {response.status_code}"
                 logger.warning(error_msg)
@@ -158,6 +467,36 @@ class GitHubTool(BaseTool):
             logger.error(f"Request error fetching repo info: {e}")
             return {"error": str(e)}
 
+    def _get_head_sha(self, repo: str, ref: str = "HEAD") -> Optional[str]:
+        """
+        Resolve a ref to its commit SHA with a single lightweight request.
+
+        Args:
+            repo: Repository identifier (owner/repo)
+            ref: Branch, tag or "HEAD" for the default branch
+
+        Returns:
+            Commit SHA, or None if it could not be resolved
+        """
+        try:
+            api_url = self.api_url
+            headers = dict(self.headers)
+            headers['Accept'] = 'application/vnd.github.sha'
+            url = f'{api_url}/repos/{repo}/commits/{ref}'
+
+            logger.debug(f"Resolving commit SHA from: {url}")
+            response = self._conditional_get(url, headers=headers)
+
+            if response.status_code == 200:
+                return response.text.strip()
+
+            logger.warning(f"Failed to resolve {ref} SHA: HTTP {response.status_code}")
+            return None
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error resolving {ref} SHA: {e}")
+            return None
+
     def _get_file_structure(self, repo: str, path: str = "") -> Dict[str, Any]:
         """
         Get repository file structure.
@@ -170,17 +509,17 @@ class GitHubTool(BaseTool):
             Dictionary with file structure
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
+            api_url = self.api_url
+            headers = self.headers
             url = f'{api_url}/repos/{repo}/contents/{path}'
 
             logger.debug(f"Fetching file structure from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._conditional_get(url, headers=headers)
 
             if response.status_code == 200:
                 data = response.json()
                 structure = []
-                for item in data[:20]:  # Limit to first 20 items
+                for item in data[:ROOT_LISTING_LIMIT]:
                     structure.append({
                         "name": item.get("name"),
                         "path": item.get("path"),
@@ -208,16 +547,15 @@ class GitHubTool(BaseTool):
             List of commit dictionaries
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
+            api_url = self.api_url
+            headers = self.headers
             url = f'{api_url}/repos/{repo}/commits'
 
             logger.debug(f"Fetching recent commits from: {url}")
-            response = requests.get(
+            response = self._conditional_get(
                 url,
                 headers=headers,
-                params={'per_page': limit},
-                timeout=30
+                params={'per_page': limit}
             )
 
             if response.status_code == 200:
@@ -253,103 +591,105 @@ class GitHubTool(BaseTool):
             README content (truncated to 1000 chars)
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
+            api_url = self.api_url
             url = f'{api_url}/repos/{repo}/readme'
 
+            # Only the first 1000 characters are kept, and a UTF-8 character is
+            # at most 4 bytes: read just enough to know whether there is more
             logger.debug(f"Fetching README from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            status_code, head = self._get_raw_head(url, max_bytes=4 * 1001)
 
-            if response.status_code == 200:
-                data = response.json()
-                # Content is base64 encoded
-                content_b64 = data.get("content", "")
+            if status_code == 200:
                 try:
-                    content = base64.b64decode(content_b64).decode('utf-8')
+                    # Incremental decoding tolerates a character cut at the end
+                    content = codecs.getincrementaldecoder('utf-8')().decode(head)
                     if len(content) > 1000:
                         content = content[:1000] + "..."
                     logger.info("Successfully fetched README")
                     return content
-                except Exception as e:
+                except UnicodeDecodeError as e:
                     logger.warning(f"Error decoding README: {e}")
                     return "README found but could not be decoded"
-            else:
+            elif status_code == 404:
                 logger.warning("README not found in repository")
                 return "README not found or inaccessible"
+            else:
+                # Rate limits and server errors are temporary; _cache_overview skips this marker
+                logger.warning(f"Failed to fetch README: HTTP {status_code}")
+                return f"Error fetching README: HTTP {status_code}"
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error fetching README: {e}")
             return f"Error fetching README: {str(e)}"
 
-    def _get_code_snippets(self, repo: str, branch: str = "main") -> Dict[str, Any]:
+    def _get_code_snippets(
+        self,
+        repo: str,
+        branch: str = "main",
+        root_files: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get code snippets from key files in the repository.
 
         Args:
             repo: Repository identifier
             branch: Branch name (default: main)
+            root_files: Complete root directory listing, if already fetched;
+                key files missing from it are not requested
 
         Returns:
             Dictionary with code snippets from key files
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
-
-            # Key files to fetch (in priority order)
-            key_files = [
-                'main.py',
-                'app.py',
-                '__init__.py',
-                'setup.py',
-                'requirements.txt',
-                'Dockerfile',
-                'docker-compose.yml',
-                'config.py',
-                'settings.py',
-                'package.json',
-                'index.js',
-                'index.ts'
-            ]
-
             snippets = {}
 
-            for filename in key_files:
-                url = f'{api_url}/repos/{repo}/contents/{filename}'
-
-                logger.debug(f"Trying to fetch code snippet: {filename}")
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    params={'ref': branch},
-                    timeout=30
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    content_b64 = data.get("content", "")
-                    try:
-                        content = base64.b64decode(content_b64).decode('utf-8')
-                        # Truncate to reasonable size (300 chars for snippets)
-                        snippet = content[:300]
-                        if len(content) > 300:
-                            snippet += "\n... (truncated)"
-
-                        # Create file link
-                        file_link = f"https://github.com/{repo}/blob/{branch}/{filename}"
-
-                        snippets[filename] = {
-                            "content": snippet,
-                            "link": file_link,
-                            "full_length": len(content)
-                        }
+            key_files = _KEY_FILES
+            if root_files is not None:
+                present = {item.get("name") for item in root_files if item.get("type") == "file"}
+                key_files = tuple(filename for filename in _KEY_FILES if filename in present)
+                if not key_files:
+                    logger.info("No key files found for code snippets")
+                    return {"message": "No key files found"}
+
+            # One GraphQL query checks every candidate at once; fall back to
+            # probing them one by one over REST if GraphQL is unavailable
+            texts = self._get_blob_texts(repo, [f"{branch}:{filename}" for filename in key_files])
+            if texts is not None:
+                for filename, content in zip(key_files, texts):
+                    if content is None:
+                        continue
+                    snippets[filename] = self._build_snippet(repo, branch, filename, content)
+                    logger.info(f"Successfully fetched snippet: {filename}")
+
+                    # Limit to 3 snippets to avoid too much data
+                    if len(snippets) >= 3:
+                        break
+            else:
+                # Probe a few candidates at a time, in priority order, and stop
+                # launching probes once three snippets have been found
+                candidates = iter(key_files)
+                pending = deque()
+
+                def probe_next() -> None:
+                    filename = next(candidates, None)
+                    if filename is not None:
+                        pending.append((filename, submit_io(self._fetch_snippet_text, repo, branch, filename)))
+
+                for _ in range(3):
+                    probe_next()
+                try:
+                    # Limit to 3 snippets to avoid too much data
+                    while pending and len(snippets) < 3:
+                        filename, future = pending.popleft()
+                        probe_next()
+                        content = future.result()
+                        if content is None:
+                            continue
+                        snippets[filename] = self._build_snippet(repo, branch, filename, content)
                         logger.info(f"Successfully fetched snippet: {filename}")
-
-                        # Limit to 3 snippets to avoid too much data
-                        if len(snippets) >= 3:
-                            break
-                    except Exception as e:
-                        logger.warning(f"Error decoding {filename}: {e}")
+                finally:
+                    for _, future in pending:
+                        future.cancel()
 
             if not snippets:
                 logger.info("No key files found for code snippets")
@@ -361,6 +701,279 @@ class GitHubTool(BaseTool):
             logger.error(f"Request error fetching code snippets: {e}")
             return {"error": str(e)}
 
+    def _fetch_snippet_text(self, repo: str, branch: str, filename: str) -> Optional[str]:
+        """Fetch a key file's text over REST, or None if it is missing or not UTF-8."""
+        url = f'{self.api_url}/repos/{repo}/contents/{filename}'
+
+        logger.debug(f"Trying to fetch code snippet: {filename}")
+        response = self._conditional_get(
+            url,
+            headers=self.raw_headers,
+            params={'ref': branch}
+        )
+
+        if response.status_code != 200:
+            return None
+        try:
+            return response.content.decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.warning(f"Error decoding {filename}: {e}")
+            return None
+
+    def _build_snippet(self, repo: str, branch: str, filename: str, content: str) -> Dict[str, Any]:
+        """Build a snippet entry holding the start of a key file."""
+        # Truncate to reasonable size (300 chars for snippets)
+        snippet = content[:300]
+        if len(content) > 300:
+            snippet += "\n... (truncated)"
+
+        return {
+            "content": snippet,
+            "link": f"https://github.com/{repo}/blob/{branch}/{filename}",
+            "full_length": len(content)
+        }
+
+    def _get_blob_texts(self, repo: str, expressions: List[str]) -> Optional[List[Optional[str]]]:
+        """
+        Fetch the text of several files with a single GraphQL query.
+
+        Args:
+            repo: Repository identifier (owner/repo)
+            expressions: Git object expressions such as 'main:setup.py'
+
+        Returns:
+            Text per expression (None where the file is missing or binary),
+            or None if the GraphQL request failed
+        """
+        declarations, fields, variables = _blob_query_parts(expressions)
+        query = (
+            f"query($owner: String!, $name: String!{declarations}) "
+            f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+
+        logger.debug(f"Fetching {len(expressions)} blobs via GraphQL")
+        repository = self._graphql_repository(repo, query, variables)
+        if repository is None:
+            return None
+
+        return [(repository.get(f"f{i}") or {}).get("text") for i in range(len(expressions))]
+
+    def _graphql_repository(self, repo: str, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run a GraphQL query against a repository.
+
+        Args:
+            repo: Repository identifier (owner/repo)
+            query: Query taking $owner and $name
+            variables: Additional query variables
+
+        Returns:
+            The "repository" object of the response, or None if the request
+            failed or GitHub reported errors (callers then fall back to REST,
+            rather than working from partial data)
+        """
+        try:
+            owner, name = repo.split('/', 1)
+            payload = {"query": query, "variables": dict(variables, owner=owner, name=name)}
+
+            rate_limiter = self._graphql_rate_limiter
+            rate_limiter.wait()
+            response = self.session.post(self.graphql_url, headers=self.headers, json=payload, timeout=GITHUB_REQUEST_TIMEOUT)
+            rate_limiter.update(response)
+
+            # Secondary rate limits answer 403 with Retry-After; wait once and retry
+            delay = rate_limiter.retry_after(response)
+            if delay is not None:
+                logger.warning(f"GitHub asked to retry GraphQL query after {delay:.0f}s")
+                time.sleep(delay)
+                response = self.session.post(self.graphql_url, headers=self.headers, json=payload, timeout=GITHUB_REQUEST_TIMEOUT)
+                rate_limiter.update(response)
+
+            if response.status_code != 200:
+                logger.warning(f"GraphQL query failed: HTTP {response.status_code}")
+                return None
+
+            body = response.json()
+            if body.get("errors"):
+                messages = "; ".join(str(error.get("message")) for error in body["errors"])
+                logger.warning(f"GraphQL query returned errors: {messages}")
+                return None
+
+            repository = (body.get("data") or {}).get("repository")
+            if repository is None:
+                logger.warning("GraphQL query returned no repository")
+                return None
+
+            return repository
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error running GraphQL query: {e}")
+            return None
+
+    def _get_repository_overview(self, repo: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch everything _run reports with a single GraphQL query.
+
+        Covers repository info, the root file listing, recent commits, the
+        README and key-file snippets, in the same shapes the REST helpers return.
+
+        Args:
+            repo: Repository identifier (owner/repo)
+
+        Returns:
+            Result dict without the "repository" key, or None if GraphQL is
+            unavailable or the repository has no default branch
+        """
+        files = _KEY_FILES + _README_FILES
+        declarations, fields, variables = _blob_query_parts([f"HEAD:{path}" for path in files])
+        query = Template(_OVERVIEW_QUERY).safe_substitute(blob_declarations=declarations, blob_fields=fields)
+        variables["commits"] = 5
+
+        logger.debug(f"Fetching repository overview via GraphQL: {repo}")
+        data = self._graphql_repository(repo, query, variables)
+        if data is None or not data.get("defaultBranchRef"):
+            return None
+
+        branch_ref = data["defaultBranchRef"]
+        branch = branch_ref["name"]
+        texts = {path: (data.get(f"f{i}") or {}).get("text") for i, path in enumerate(files)}
+
+        repo_info = {
+            "id": data.get("databaseId"),
+            "name": data.get("name"),
+            "full_name": data.get("nameWithOwner"),
+            "description": data.get("description"),
+            "default_branch": branch,
+            "visibility": "private" if data.get("isPrivate") else "public",
+            "stargazers_count": data.get("stargazerCount"),
+            "forks_count": data.get("forkCount"),
+            # REST counts open pull requests as issues too
+            "open_issues_count": (
+                ((data.get("issues") or {}).get("totalCount") or 0)
+                + ((data.get("pullRequests") or {}).get("totalCount") or 0)
+            ),
+            "topics": [
+                node["topic"]["name"]
+                for node in (data.get("repositoryTopics") or {}).get("nodes") or []
+                if node and node.get("topic")
+            ],
+            "created_at": data.get("createdAt"),
+            "updated_at": data.get("updatedAt"),
+            "pushed_at": data.get("pushedAt"),
+            "html_url": data.get("url"),
+            "language": (data.get("primaryLanguage") or {}).get("name"),
+            "license": (data.get("licenseInfo") or {}).get("name")
+        }
+
+        entries = (data.get("tree") or {}).get("entries") or []
+        file_structure = {"files": [
+            {
+                "name": entry["name"],
+                "path": entry["path"],
+                "type": _TREE_ENTRY_TYPES.get(entry["type"], entry["type"]),
+                "size": (entry.get("object") or {}).get("byteSize", 0)
+            }
+            for entry in entries[:ROOT_LISTING_LIMIT]
+        ]}
+
+        history = ((branch_ref.get("target") or {}).get("history") or {}).get("nodes") or []
+        commits = [
+            {
+                "sha": node["oid"][:7],
+                "message": node.get("messageHeadline", ""),
+                "author_name": (node.get("author") or {}).get("name", ""),
+                "author_date": (node.get("author") or {}).get("date", ""),
+                "html_url": node.get("url", "")
+            }
+            for node in history
+        ]
+
+        readme = next((texts[path] for path in _README_FILES if texts[path] is not None), None)
+        if readme is None:
+            # Readme.md, README.markdown, docs/README.md, ...: let REST find it
+            readme = self._get_readme(repo)
+        elif len(readme) > 1000:
+            readme = readme[:1000] + "..."
+
+        snippets = {}
+        for path in _KEY_FILES:
+            if texts[path] is not None:
+                snippets[path] = self._build_snippet(repo, branch, path, texts[path])
+                # Limit to 3 snippets to avoid too much data
+                if len(snippets) >= 3:
+                    break
+
+        return {
+            "info": repo_info,
+            "file_structure": file_structure,
+            "recent_commits": commits,
+            "readme": readme,
+            "code_snippets": snippets or {"message": "No key files found"}
+        }
+
+    def _fetch_code_file(self, repo: str, branch: str, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and decode a single code file.
+
+        Args:
+            repo: Repository identifier
+            branch: Branch name
+            file_path: Path of the file in the repository
+
+        Returns:
+            File entry with name, path, link, content and lines, or None if
+            the file could not be fetched or decoded
+        """
+        api_url = self.api_url
+        headers = self.raw_headers
+
+        file_url = f'{api_url}/repos/{repo}/contents/{file_path}'
+
+        logger.debug(f"Fetching code file: {file_path}")
+        file_response = self._conditional_get(
+            file_url,
+            headers=headers,
+            params={'ref': branch}
+        )
+
+        if file_response.status_code != 200:
+            return None
+
+        try:
+            content = file_response.content.decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.warning(f"Error decoding {file_path}: {e}")
+            return None
+
+        return self._build_code_file(repo, branch, file_path, content)
+
+    def _build_code_file(self, repo: str, branch: str, file_path: str, content: str) -> Dict[str, Any]:
+        """Build a code file entry, truncating very long files."""
+        file_name = file_path.split('/')[-1]
+
+        # Create file link
+        file_link = f"https://github.com/{repo}/blob/{branch}/{file_path}"
+
+        # Limit content to reasonable size (first 1000 lines or 50KB), counting
+        # and cutting lines in place rather than splitting the whole file
+        line_count = content.count('\n') + 1
+        if line_count > 1000:
+            cut = -1
+            for _ in range(1000):
+                cut = content.find('\n', cut + 1)
+            content = content[:cut] + "\n... (truncated)"
+        elif len(content) > 50000:
+            content = content[:50000] + "\n... (truncated)"
+
+        logger.info(f"Successfully fetched: {file_path} ({line_count} lines)")
+        return {
+            "name": file_name,
+            "path": file_path,
+            "link": file_link,
+            "content": content,
+            "lines": line_count
+        }
+
     def _get_code_files_from_directory(self, repo: str, branch: str = "main", directory: str = "src", max_files: int = 10) -> Dict[str, Any]:
         """
         Recursively fetch code files from a specific directory.
@@ -375,36 +988,40 @@ class GitHubTool(BaseTool):
             Dictionary with code files and their contents
         """
         try:
-            api_url = getattr(self, 'api_url')
-            headers = getattr(self, 'headers')
+            api_url = self.api_url
+            headers = self.headers
 
-            # Get directory contents recursively using git trees API
-            url = f'{api_url}/repos/{repo}/git/trees/{branch}?recursive=1'
+            # Handle root directory, and "./src" or "src/" style directory names
+            directory = directory.strip().strip('/')
+            if directory.startswith('./'):
+                directory = directory[2:]
+            is_root = directory in ('.', '')
+            prefix = None if is_root else f"{directory}/"
 
             logger.info(f"Fetching code files from {directory}/ directory")
-            response = requests.get(url, headers=headers, timeout=30)
 
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch directory tree: HTTP {response.status_code}")
-                return {"error": f"Failed to fetch directory tree: {response.status_code}"}
-
-            tree = response.json().get("tree", [])
-
-            # Supported code file extensions
-            code_extensions = (
-                '.py', '.js', '.ts', '.jsx', '.tsx',  # Python, JavaScript, TypeScript
-                '.java', '.kt', '.scala',              # JVM languages
-                '.go', '.rs', '.rb',                   # Go, Rust, Ruby
-                '.php', '.c', '.cpp', '.h', '.hpp',    # PHP, C/C++
-                '.cs', '.swift', '.m',                 # C#, Swift, Objective-C
-                '.sql', '.sh', '.bash',                # SQL, Shell
-                '.yaml', '.yml', '.json', '.toml',     # Config files
-                '.md', '.rst', '.txt',                 # Documentation
-                '.html', '.css', '.scss',              # Web files
-            )
+            # Get directory contents recursively using git trees API. Ask for just
+            # the directory's subtree when possible: the whole repository's tree
+            # can be megabytes of entries that would all be filtered out
+            tree = None
+            base = ""
+            if not is_root:
+                url = f'{api_url}/repos/{repo}/git/trees/{branch}:{directory}?recursive=1'
+                response = self._conditional_get(url, headers=headers)
+                if response.status_code == 200:
+                    tree = response.json().get("tree", [])
+                    # Subtree paths are relative to the directory
+                    base = prefix
+
+            if tree is None:
+                url = f'{api_url}/repos/{repo}/git/trees/{branch}?recursive=1'
+                response = self._conditional_get(url, headers=headers)
 
-            # Handle root directory
-            is_root = directory in ('.', '', '/')
+                if response.status_code != 200:
+                    logger.warning(f"Failed to fetch directory tree: HTTP {response.status_code}")
+                    return {"error": f"Failed to fetch directory tree: {response.status_code}"}
+
+                tree = response.json().get("tree", [])
 
             # Filter for code files in the specified directory
             code_files_list = []
@@ -412,66 +1029,45 @@ class GitHubTool(BaseTool):
                 if item.get('type') != 'blob':
                     continue
 
-                path = item.get('path', '')
+                path = base + item.get('path', '')
 
                 # Check if file has a supported extension
-                if not any(path.endswith(ext) for ext in code_extensions):
+                if splitext(path)[1] not in _CODE_EXTENSIONS:
                     continue
 
                 # Check directory match
-                if is_root:
-                    # For root, include files at root level or in any subdirectory
-                    code_files_list.append(item)
-                elif path.startswith(f"{directory}/"):
+                if base:
+                    # Every subtree entry is inside the directory
+                    code_files_list.append(dict(item, path=path))
+                elif prefix is None or path.startswith(prefix):
+                    # For root (no prefix), include files at any depth
                     code_files_list.append(item)
 
             if not code_files_list:
                 logger.info(f"No code files found in {directory}/")
                 return {"message": f"No code files found in {directory}/"}
 
-            # Fetch content of files (limit to max_files)
-            code_files = {}
-            for file_item in code_files_list[:max_files]:
-                file_path = file_item.get('path')
-                file_name = file_path.split('/')[-1]
-
-                # Fetch file content
-                file_url = f'{api_url}/repos/{repo}/contents/{file_path}'
-
-                logger.debug(f"Fetching code file: {file_path}")
-                file_response = requests.get(
-                    file_url,
-                    headers=headers,
-                    params={'ref': branch},
-                    timeout=30
+            # Spend the fetch budget on the most useful files: known entry points
+            # first, then smaller files, which are quicker to fetch; empty files last
+            code_files_list.sort(key=_code_file_priority)
+
+            # Fetch content of files (limit to max_files) in one GraphQL query,
+            # or concurrently over REST if GraphQL is unavailable
+            paths = [file_item.get('path') for file_item in code_files_list[:max_files]]
+            texts = self._get_blob_texts(repo, [f"{branch}:{path}" for path in paths])
+            if texts is not None:
+                fetched = [
+                    self._build_code_file(repo, branch, path, content)
+                    for path, content in zip(paths, texts)
+                    if content is not None
+                ]
+            else:
+                fetched = map_io(
+                    lambda file_path: self._fetch_code_file(repo, branch, file_path),
+                    paths,
+                    max_concurrency=GITHUB_FETCH_CONCURRENCY
                 )
-
-                if file_response.status_code == 200:
-                    data = file_response.json()
-                    content_b64 = data.get("content", "")
-                    try:
-                        content = base64.b64decode(content_b64).decode('utf-8')
-
-                        # Create file link
-                        file_link = f"https://github.com/{repo}/blob/{branch}/{file_path}"
-
-                        # Limit content to reasonable size (first 1000 lines or 50KB)
-                        lines = content.split('\n')
-                        if len(lines) > 1000:
-                            content = '\n'.join(lines[:1000]) + "\n... (truncated)"
-                        elif len(content) > 50000:
-                            content = content[:50000] + "\n... (truncated)"
-
-                        code_files[file_path] = {
-                            "name": file_name,
-                            "path": file_path,
-                            "link": file_link,
-                            "content": content,
-                            "lines": len(lines)
-                        }
-                        logger.info(f"Successfully fetched: {file_path} ({len(lines)} lines)")
-                    except Exception as e:
-                        logger.warning(f"Error decoding {file_path}: {e}")
+            code_files = {entry["path"]: entry for entry in fetched if entry is not None}
 
             logger.info(f"Fetched {len(code_files)} code files from {directory}/")
             return {
@@ -483,3 +1079,18 @@ class GitHubTool(BaseTool):
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error fetching code files: {e}")
             return {"error": str(e)}
+
+
+@lru_cache(maxsize=8)
+def get_shared_github_tool(api_url: str, token: str) -> GitHubTool:
+    """
+    Get the GitHubTool shared by every caller using the same GitHub credentials.
+
+    Args:
+        api_url: GitHub API URL from settings
+        token: GitHub token from settings
+
+    Returns:
+        Cached GitHubTool instance
+    """
+    return GitHubTool(api_url=api_url, token=token)
@@ -1,13 +1,24 @@
 """Google Drive MCP Tool for CrewAI - Searches and retrieves Google Drive documents"""
 import json
 import requests
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
 from src.config.settings import get_settings
-from src.config.constants import DEFAULT_DRIVE_TOP_K
+from src.config.constants import (
+    DEFAULT_DRIVE_TOP_K,
+    DRIVE_CACHE_SIZE,
+    DRIVE_FILE_CACHE_TTL,
+    DRIVE_PREVIEW_CHARS,
+    DRIVE_SEARCH_CACHE_TTL,
+    MCP_GET_FILE_TIMEOUT
+)
+from src.utils.cache import TTLCache
+from src.utils.concurrency import map_io, run_io
+from src.utils.http import get_http_session
 from src.utils.logger import setup_logger
+from src.utils.serialization import to_compact_json
 
 logger = setup_logger(__name__)
 
@@ -64,34 +75,61 @@ class GoogleDriveMCPTool(BaseTool):
             **kwargs
         )
 
+        object.__setattr__(self, '_session', get_http_session())
+        # Agents repeat searches within a run; failed or empty lookups are not cached
+        object.__setattr__(self, '_search_cache', TTLCache(maxsize=DRIVE_CACHE_SIZE, ttl=DRIVE_SEARCH_CACHE_TTL))
+        object.__setattr__(self, '_file_cache', TTLCache(maxsize=DRIVE_CACHE_SIZE, ttl=DRIVE_FILE_CACHE_TTL))
+
         # Verify MCP server is reachable
         object.__setattr__(self, '_initialized', False)
+        object.__setattr__(self, '_supports_batch', False)
         if self.access_token:
             self._initialize_mcp()
 
     def _initialize_mcp(self):
-        """Verify MCP server is reachable."""
+        """
+        Verify MCP server is reachable and note whether it offers batch_execute.
+
+        The probe result is assigned only once it is known, so a shared tool
+        stays usable by other crews while it is being re-probed.
+        """
+        initialized = False
+        supports_batch = False
         if not self.access_token:
             logger.warning("No Google Drive access token provided - MCP tools disabled")
-            return
-
-        try:
-            response = requests.post(
-                self.mcp_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 0,
-                    "method": "tools/list"
-                },
-                timeout=5
-            )
-            if response.status_code == 200:
-                logger.info(f"MCP Drive server reachable at {self.mcp_url}")
-                object.__setattr__(self, '_initialized', True)
-            else:
-                logger.warning(f"MCP server returned status {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"MCP server not reachable at {self.mcp_url}: {e}")
+        else:
+            try:
+                response = self._session.post(
+                    self.mcp_url,
+                    json={
+                        "jsonrpc": "2.0",
+                        "id": 0,
+                        "method": "tools/list"
+                    },
+                    timeout=5
+                )
+                if response.status_code == 200:
+                    logger.info(f"MCP Drive server reachable at {self.mcp_url}")
+                    initialized = True
+                    try:
+                        tools = (response.json().get("result") or {}).get("tools") or []
+                    except ValueError:
+                        tools = []
+                    if any(tool.get("name") == "batch_execute" for tool in tools):
+                        logger.info("MCP Drive server supports batch_execute")
+                        supports_batch = True
+                else:
+                    logger.warning(f"MCP server returned status {response.status_code}")
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"MCP server not reachable at {self.mcp_url}: {e}")
+
+        object.__setattr__(self, '_initialized', initialized)
+        object.__setattr__(self, '_supports_batch', supports_batch)
+
+    def clear_cache(self) -> None:
+        """Forget cached search results and file contents so the next call goes to the MCP server."""
+        self._search_cache.clear()
+        self._file_cache.clear()
 
     def is_available(self) -> bool:
         """Check if MCP tools are available."""
@@ -122,20 +160,37 @@ class GoogleDriveMCPTool(BaseTool):
             # Generic Drive file viewer
             return f"https://drive.google.com/file/d/{file_id}"
 
-    def _run(self, query: str) -> str:
+    def _run(self, query: str, preview_len: int = DRIVE_PREVIEW_CHARS) -> str:
         """
         Search Google Drive and retrieve document content.
 
         Args:
             query: Search query or document name
+            preview_len: Characters of content returned per file (at most DRIVE_PREVIEW_CHARS)
 
         Returns:
             JSON string with search results and file contents
         """
+        return to_compact_json(self._run_native(query, preview_len=preview_len))
+
+    def _run_native(self, query: str, preview_len: int = DRIVE_PREVIEW_CHARS) -> Dict[str, Any]:
+        """
+        Search Google Drive and retrieve document content as a dict.
+
+        Python callers use this directly to skip serializing and re-parsing
+        the JSON string that _run hands to agents.
+
+        Args:
+            query: Search query or document name
+            preview_len: Characters of content returned per file (at most DRIVE_PREVIEW_CHARS)
+
+        Returns:
+            Dict with search results and file contents
+        """
         if not self.is_available():
             error_msg = "Google Drive MCP tools not available. Check access token and MCP server."
             logger.error(error_msg)
-            return json.dumps({"error": error_msg})
+            return {"error": error_msg}
 
         try:
             logger.info(f"Searching Google Drive for: {query}")
@@ -145,49 +200,58 @@ class GoogleDriveMCPTool(BaseTool):
 
             if not files:
                 logger.info(f"No files found matching '{query}'")
-                return json.dumps({
+                return {
                     "query": query,
                     "files_found": 0,
                     "message": f"No files found matching '{query}'"
-                })
+                }
+
+            # Get content of first few files (limit to prevent overload); the
+            # get_file calls are independent, so batch them into one request
+            # when the server allows it and make them concurrently otherwise
+            selected = [file_info for file_info in files[:self.top_k] if file_info.get("uri")]
+            uris = [file_info["uri"] for file_info in selected]
+            previews = None
+            if self._supports_batch and len(uris) > 1:
+                previews = self._get_file_previews_batched(uris)
+            if previews is None:
+                previews = map_io(self._get_file_preview, uris)
 
-            # Get content of first few files (limit to prevent overload)
             results = []
-            for file_info in files[:self.top_k]:
-                file_uri = file_info.get("uri")
+            for file_info, (preview, content_length) in zip(selected, previews):
+                file_uri = file_info["uri"]
                 file_name = file_info.get("name")
                 mime_type = file_info.get("mimeType", "")
 
-                if file_uri:
-                    logger.debug(f"Retrieving file: {file_name}")
-                    file_content = self._get_file(file_uri)
-                    content = file_content.get("content", "")
-
-                    # Convert URI to clickable URL
-                    clickable_url = self._convert_uri_to_url(file_uri, mime_type)
+                # Convert URI to clickable URL
+                clickable_url = self._convert_uri_to_url(file_uri, mime_type)
 
-                    results.append({
-                        "name": file_name,
-                        "uri": file_uri,
-                        "url": clickable_url,  # Add clickable URL
-                        "mimeType": mime_type,
-                        "content": content[:2000],  # Limit to first 2000 chars
-                        "full_content_length": len(content)
-                    })
-                    logger.info(f"Converted {file_name} URI to URL: {clickable_url}")
+                results.append({
+                    "name": file_name,
+                    "uri": file_uri,
+                    "url": clickable_url,  # Add clickable URL
+                    "mimeType": mime_type,
+                    "content": preview[:preview_len],
+                    "full_content_length": content_length
+                })
+                logger.info(f"Converted {file_name} URI to URL: {clickable_url}")
 
             logger.info(f"Retrieved {len(results)} files from Google Drive")
-            return json.dumps({
+            return {
                 "query": query,
                 "files_found": len(files),
                 "files_retrieved": len(results),
                 "files": results
-            }, indent=2)
+            }
 
         except Exception as e:
             error_msg = f"Error searching Google Drive: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return json.dumps({"error": error_msg})
+            return {"error": error_msg}
+
+    async def arun(self, query: str, preview_len: int = DRIVE_PREVIEW_CHARS) -> str:
+        """Async variant of _run that performs the blocking search on the shared I/O pool."""
+        return await run_io(self._run, query, preview_len=preview_len)
 
     def _search_files(self, query: str) -> List[Dict[str, str]]:
         """
@@ -199,6 +263,12 @@ class GoogleDriveMCPTool(BaseTool):
         Returns:
             List of dicts with file metadata
         """
+        cache_key = query.strip().lower()
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached Drive search results for '{query}'")
+            return cached
+
         try:
             request_data = {
                 "jsonrpc": "2.0",
@@ -213,10 +283,9 @@ class GoogleDriveMCPTool(BaseTool):
                 }
             }
 
-            response = requests.post(
+            response = self._session.post(
                 self.mcp_url,
                 json=request_data,
-                headers={"Content-Type": "application/json"},
                 timeout=90
             )
 
@@ -243,6 +312,8 @@ class GoogleDriveMCPTool(BaseTool):
                 search_data = json.loads(text)
                 files = search_data.get("files", [])
                 logger.info(f"Found {len(files)} files matching '{query}'")
+                if files:
+                    self._search_cache.set(cache_key, files)
                 return files
             except json.JSONDecodeError:
                 logger.error("Failed to parse search results as JSON")
@@ -252,6 +323,141 @@ class GoogleDriveMCPTool(BaseTool):
             logger.error(f"Drive search request failed: {e}")
             return []
 
+    def _get_file_preview(self, uri: str) -> Tuple[str, int]:
+        """
+        Get the start of a file's content and its full length.
+
+        Only the preview is kept (and cached), so a multi-megabyte document is
+        released as soon as it has been measured instead of staying alive
+        until every file has been fetched.
+
+        Args:
+            uri: File URI from search results (e.g., "gdrive:///fileId")
+
+        Returns:
+            Tuple of the first DRIVE_PREVIEW_CHARS characters of the content and its full length
+        """
+        cached = self._file_cache.get(uri)
+        if cached is not None:
+            logger.debug(f"Using cached Drive file: {uri}")
+            return cached
+
+        file_data = self._get_file(uri)
+        content = file_data.get("content", "")
+        preview = (content[:DRIVE_PREVIEW_CHARS], len(content))
+        if file_data:
+            self._file_cache.set(uri, preview)
+        return preview
+
+    def _get_file_previews_batched(self, uris: List[str]) -> Optional[List[Tuple[str, int]]]:
+        """
+        Get previews for several files, fetching the uncached ones in one batch_execute call.
+
+        Args:
+            uris: File URIs from search results
+
+        Returns:
+            Preview and full length per URI, or None if the batch call failed
+        """
+        previews = {uri: self._file_cache.get(uri) for uri in uris}
+        missing = [uri for uri, preview in previews.items() if preview is None]
+
+        if missing:
+            file_data_list = self._batch_mcp([
+                {"tool": "get_file", "arguments": {"uri": uri, "access_token": self.access_token}}
+                for uri in missing
+            ])
+            if file_data_list is None:
+                # Don't pay for a failing batch again; the next health probe re-enables it
+                logger.warning("Disabling MCP batch_execute after a failed batch")
+                object.__setattr__(self, '_supports_batch', False)
+                return None
+
+            for uri, file_data in zip(missing, file_data_list):
+                content = file_data.get("content", "")
+                previews[uri] = (content[:DRIVE_PREVIEW_CHARS], len(content))
+                if file_data:
+                    self._file_cache.set(uri, previews[uri])
+
+        return [previews[uri] for uri in uris]
+
+    def _batch_mcp(self, calls: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run several MCP tool calls in one request through the server's batch_execute tool.
+
+        Assumed server contract, checked against the payload and treated as a
+        failure when it does not hold: batch_execute takes
+        {"operations": [{"tool", "arguments"}, ...], "maxConcurrent": n} and
+        answers with a tools/call result whose first text content is a JSON
+        list, or {"results": [...]}, with one entry per operation in request
+        order. Each entry is that operation's own tool result
+        ({"content": [{"text": ...}], "isError": bool}). The operations run
+        concurrently, so the batch gets the same timeout as a single get_file.
+
+        Args:
+            calls: Operations as {"tool": name, "arguments": {...}}
+
+        Returns:
+            Parsed JSON payload per operation ({} where an operation failed),
+            or None if the batch request itself failed
+        """
+        try:
+            request_data = {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {
+                    "name": "batch_execute",
+                    "arguments": {
+                        "operations": calls,
+                        "maxConcurrent": len(calls)
+                    }
+                }
+            }
+
+            logger.debug(f"Running {len(calls)} MCP calls with batch_execute")
+            response = self._session.post(
+                self.mcp_url,
+                json=request_data,
+                timeout=MCP_GET_FILE_TIMEOUT
+            )
+
+            if response.status_code != 200:
+                logger.warning(f"MCP batch_execute failed: HTTP {response.status_code}")
+                return None
+
+            json_response = response.json()
+            if "error" in json_response or "result" not in json_response:
+                logger.warning(f"MCP batch_execute returned no result: {json_response.get('error')}")
+                return None
+
+            content = json_response["result"].get("content", [])
+            if not content:
+                return None
+
+            batch_data = json.loads(content[0].get("text", ""))
+            if isinstance(batch_data, dict):
+                batch_data = batch_data.get("results")
+            if not isinstance(batch_data, list) or len(batch_data) != len(calls):
+                logger.warning("MCP batch_execute returned an unexpected payload")
+                return None
+
+            # Each entry is the sub-operation's own tool result
+            results = []
+            for entry in batch_data:
+                entry = entry or {}
+                entry_content = entry.get("content") or [{}]
+                try:
+                    data = json.loads(entry_content[0].get("text", ""))
+                except json.JSONDecodeError:
+                    data = {}
+                results.append(data if isinstance(data, dict) and not entry.get("isError") else {})
+            return results
+
+        except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+            logger.warning(f"MCP batch_execute request failed: {e}")
+            return None
+
     def _get_file(self, uri: str) -> Dict[str, Any]:
         """
         Get file content from Google Drive using MCP get_file tool via HTTP.
@@ -263,6 +469,7 @@ class GoogleDriveMCPTool(BaseTool):
             Dict with file metadata and content
         """
         try:
+            logger.debug(f"Retrieving file: {uri}")
             request_data = {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -276,11 +483,10 @@ class GoogleDriveMCPTool(BaseTool):
                 }
             }
 
-            response = requests.post(
+            response = self._session.post(
                 self.mcp_url,
                 json=request_data,
-                headers={"Content-Type": "application/json"},
-                timeout=180
+                timeout=MCP_GET_FILE_TIMEOUT
             )
 
             if response.status_code != 200:
@@ -0,0 +1,116 @@
+"""Shared thread pool for blocking tool I/O"""
+import asyncio
+import functools
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+from src.config.constants import IO_POOL_MAX_WORKERS
+
+IO_THREAD_PREFIX = "tara-io"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor used for blocking HTTP calls made by tools.
+
+    Returns:
+        Lazily created ThreadPoolExecutor shared by all tools
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=IO_POOL_MAX_WORKERS,
+                    thread_name_prefix=IO_THREAD_PREFIX
+                )
+    return _executor
+
+
+def _on_io_thread() -> bool:
+    """Return True when running on one of the shared I/O executor's workers."""
+    return threading.current_thread().name.startswith(IO_THREAD_PREFIX)
+
+
+def submit_io(func: Callable[..., Any], *args, **kwargs) -> "Future[Any]":
+    """
+    Start a blocking function on the shared I/O executor.
+
+    When called from an I/O worker thread the function runs inline and an
+    already completed future is returned, so nested fan-out cannot deadlock.
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Future holding the value returned by func
+    """
+    if not _on_io_thread():
+        return get_io_executor().submit(func, *args, **kwargs)
+
+    future: "Future[Any]" = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+async def run_io(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function on the shared I/O executor without blocking the event loop.
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The value returned by func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(func, *args, **kwargs))
+
+
+def map_io(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: Optional[int] = None
+) -> List[Any]:
+    """
+    Apply a blocking function to each item concurrently on the shared I/O executor.
+
+    When called from an I/O worker thread the items are processed inline, so
+    nested fan-out can never wait on the pool it is occupying and deadlock.
+
+    Args:
+        func: Blocking callable taking one item
+        items: Items to process
+        max_concurrency: Optional cap on calls in flight at once
+
+    Returns:
+        Results in the same order as items
+    """
+    items = list(items)
+    if len(items) <= 1 or _on_io_thread():
+        return [func(item) for item in items]
+
+    executor = get_io_executor()
+    if max_concurrency is None or max_concurrency >= len(items):
+        return list(executor.map(func, items))
+
+    # Keep a window of max_concurrency calls in flight, refilling as results are taken
+    pending = deque(executor.submit(func, item) for item in items[:max_concurrency])
+    results = []
+    for item in items[max_concurrency:]:
+        results.append(pending.popleft().result())
+        pending.append(executor.submit(func, item))
+    results.extend(future.result() for future in pending)
+    return results
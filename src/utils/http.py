@@ -0,0 +1,75 @@
+"""Shared HTTP session for tool traffic"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.constants import (
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF_FACTOR
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    pool_connections: int = HTTP_POOL_CONNECTIONS
+) -> requests.Session:
+    """
+    Create a requests Session with a keep-alive connection pool per host.
+
+    pool_maxsize should be at least the number of threads sharing the session,
+    otherwise urllib3 opens and discards extra connections under load.
+
+    Idempotent requests are retried on connection errors and on 502/503/504
+    with exponential backoff. POSTs are not retried. Rate limiting (429, and
+    GitHub's 403) is left to the caller: a Retry-After wait here would be
+    unbounded and would stack with GitHubTool's own capped retry.
+
+    Args:
+        pool_maxsize: Maximum pooled connections kept open per host
+        pool_connections: Number of per-host pools kept
+
+    Returns:
+        Configured Session instance
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=(502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide Session shared by all tools.
+
+    Reusing one Session keeps TCP/TLS connections to GitHub and the MCP
+    server alive across tool calls instead of handshaking on every request.
+
+    Returns:
+        Lazily created shared Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
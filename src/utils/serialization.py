@@ -0,0 +1,19 @@
+"""JSON helpers for tool output"""
+import json
+from typing import Any, Dict
+
+
+def to_compact_json(data: Dict[str, Any]) -> str:
+    """
+    Serialize tool output as single-line JSON.
+
+    Tool results are pasted into the agent's prompt, so separators carry no
+    padding and non-ASCII text is kept as-is rather than escaped.
+
+    Args:
+        data: JSON-serializable tool result
+
+    Returns:
+        JSON string without whitespace between tokens
+    """
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
@@ -2,6 +2,16 @@
 import re
 from typing import Optional
 
+from src.config.constants import MIN_ACCESS_TOKEN_LENGTH
+
+# GitHub repo format: owner/repo
+# Owner and repo can contain alphanumeric, hyphens, and underscores
+# Owner cannot start with hyphen
+_GITHUB_REPO_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*/[a-zA-Z0-9][a-zA-Z0-9_.-]*$')
+_URL_RE = re.compile(r'^https?://[\w\-\.]+(:\d+)?(/.*)?$')
+# Invalid filename characters, each mapped to an underscore
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
 
 def validate_github_repo(repo: str) -> bool:
     """
@@ -16,11 +26,7 @@ def validate_github_repo(repo: str) -> bool:
     if not repo:
         return False
 
-    # GitHub repo format: owner/repo
-    # Owner and repo can contain alphanumeric, hyphens, and underscores
-    # Owner cannot start with hyphen
-    pattern = r'^[a-zA-Z0-9][a-zA-Z0-9_-]*/[a-zA-Z0-9][a-zA-Z0-9_.-]*$'
-    return bool(re.match(pattern, repo))
+    return bool(_GITHUB_REPO_RE.match(repo))
 
 
 def validate_url(url: str) -> bool:
@@ -36,8 +42,7 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
 
-    pattern = r'^https?://[\w\-\.]+(:\d+)?(/.*)?$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -51,7 +56,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid filename characters with underscores
-    return re.sub(r'[<>:"/\\|?*]', '_', filename)
+    return filename.translate(_FILENAME_TRANSLATION)
 
 
 def validate_access_token(token: Optional[str]) -> bool:
@@ -64,8 +69,4 @@ def validate_access_token(token: Optional[str]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not token:
-        return False
-
-    # Tokens are usually at least 20 characters
-    return len(token) >= 20
+    return isinstance(token, str) and len(token) >= MIN_ACCESS_TOKEN_LENGTH
@@ -0,0 +1,53 @@
+"""Tests for the TTL/LRU cache"""
+from unittest import mock
+
+from src.utils import cache as cache_module
+from src.utils.cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=4, ttl=10)
+    with mock.patch.object(cache_module.time, "monotonic", return_value=100.0) as monotonic:
+        cache.set("key", "value")
+
+        monotonic.return_value = 109.9
+        assert cache.get("key") == "value"
+
+        monotonic.return_value = 110.0
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+        assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_setting_an_existing_key_refreshes_its_value_and_ttl():
+    cache = TTLCache(maxsize=2, ttl=10)
+    with mock.patch.object(cache_module.time, "monotonic", return_value=0.0) as monotonic:
+        cache.set("key", "old")
+        monotonic.return_value = 8.0
+        cache.set("key", "new")
+        monotonic.return_value = 15.0
+
+        assert cache.get("key") == "new"
+
+
+def test_clear_drops_every_entry():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
@@ -0,0 +1,64 @@
+"""Tests for the shared I/O thread pool helpers"""
+import threading
+import time
+
+from src.utils.concurrency import IO_THREAD_PREFIX, get_io_executor, map_io, submit_io
+
+
+def test_map_io_keeps_item_order_when_calls_finish_out_of_order():
+    def slow_for_small(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 10
+
+    assert map_io(slow_for_small, range(5), max_concurrency=2) == [0, 10, 20, 30, 40]
+
+
+def test_map_io_never_exceeds_max_concurrency():
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def track(item):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return item
+
+    assert map_io(track, range(8), max_concurrency=3) == list(range(8))
+    assert 1 < peak <= 3
+
+
+def test_map_io_runs_inline_on_an_io_thread():
+    def outer():
+        caller = threading.current_thread().name
+        names = map_io(lambda _: threading.current_thread().name, range(4), max_concurrency=2)
+        return caller, names
+
+    caller, names = get_io_executor().submit(outer).result(timeout=5)
+
+    assert caller.startswith(IO_THREAD_PREFIX)
+    assert names == [caller] * 4
+
+
+def test_submit_io_runs_inline_on_an_io_thread():
+    def outer():
+        future = submit_io(lambda: threading.current_thread().name)
+        return threading.current_thread().name, future.done(), future.result()
+
+    caller, done, name = get_io_executor().submit(outer).result(timeout=5)
+
+    assert done
+    assert name == caller
+
+
+def test_submit_io_captures_exceptions_raised_inline():
+    def fail():
+        raise ValueError("boom")
+
+    future = get_io_executor().submit(lambda: submit_io(fail)).result(timeout=5)
+
+    assert isinstance(future.exception(), ValueError)
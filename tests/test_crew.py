@@ -0,0 +1,169 @@
+"""Tests for DocumentationCrew's on-disk learning path cache"""
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.core import crew as crew_module
+from src.core.crew import DocumentationCrew
+
+REPO = "owner/repo"
+HEAD_SHA = "b" * 40
+
+
+@pytest.fixture
+def documentation_crew(tmp_path, monkeypatch):
+    """A Drive-less crew whose cache lives in tmp_path and whose writer is mocked."""
+    monkeypatch.setattr(crew_module, "DOCUMENTATION_CACHE_DIR", str(tmp_path))
+    settings = SimpleNamespace(github=SimpleNamespace(api_url="https://api.github.com", token="token"))
+    with mock.patch.object(crew_module, "get_settings", return_value=settings):
+        documentation_crew = DocumentationCrew()
+    documentation_crew.github_tool = mock.Mock()
+    documentation_crew.github_tool._get_head_sha.return_value = HEAD_SHA
+    documentation_crew._run_learning_path_crew = mock.Mock(return_value=("# Learning Path", True))
+    return documentation_crew
+
+
+def test_cache_miss_generates_and_stores(documentation_crew):
+    result = documentation_crew.generate_documentation(REPO)
+
+    assert result["documentation"] == "# Learning Path"
+    documentation_crew._run_learning_path_crew.assert_called_once()
+    cache_path = documentation_crew._documentation_cache_path(REPO, HEAD_SHA, False)
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == result
+
+
+def test_cache_hit_skips_the_crew(documentation_crew):
+    first = documentation_crew.generate_documentation(REPO)
+    second = documentation_crew.generate_documentation(REPO)
+
+    assert second == first
+    documentation_crew._run_learning_path_crew.assert_called_once()
+
+
+def test_new_head_sha_misses_the_cache(documentation_crew):
+    documentation_crew.generate_documentation(REPO)
+    documentation_crew.github_tool._get_head_sha.return_value = "c" * 40
+    documentation_crew.generate_documentation(REPO)
+
+    assert documentation_crew._run_learning_path_crew.call_count == 2
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"repository": "owner/repo"}'])
+def test_corrupt_cache_file_is_regenerated(documentation_crew, content):
+    cache_path = documentation_crew._documentation_cache_path(REPO, HEAD_SHA, False)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(content, encoding="utf-8")
+
+    result = documentation_crew.generate_documentation(REPO)
+
+    assert result["documentation"] == "# Learning Path"
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == result
+
+
+def test_expired_cache_entry_is_regenerated(documentation_crew):
+    documentation_crew.generate_documentation(REPO)
+    cache_path = documentation_crew._documentation_cache_path(REPO, HEAD_SHA, False)
+    expired = time.time() - crew_module.DOCUMENTATION_CACHE_TTL - 1
+    os.utime(cache_path, (expired, expired))
+
+    documentation_crew.generate_documentation(REPO)
+
+    assert documentation_crew._run_learning_path_crew.call_count == 2
+
+
+def test_cache_is_pruned_to_its_size_cap(documentation_crew, tmp_path, monkeypatch):
+    monkeypatch.setattr(crew_module, "DOCUMENTATION_CACHE_MAX_ENTRIES", 2)
+    for index in range(3):
+        documentation_crew.github_tool._get_head_sha.return_value = str(index) * 40
+        documentation_crew.generate_documentation(REPO)
+        stamp = time.time() - 10 + index
+        os.utime(documentation_crew._documentation_cache_path(REPO, str(index) * 40, False), (stamp, stamp))
+
+    documentation_crew.github_tool._get_head_sha.return_value = "3" * 40
+    documentation_crew.generate_documentation(REPO)
+
+    remaining = {path.name for path in tmp_path.glob("*.json")}
+    assert len(remaining) == 2
+    assert documentation_crew._documentation_cache_path(REPO, "3" * 40, False).name in remaining
+    assert documentation_crew._documentation_cache_path(REPO, "2" * 40, False).name in remaining
+
+
+def test_learning_path_written_without_github_data_is_not_cached(documentation_crew, tmp_path):
+    documentation_crew._run_learning_path_crew.return_value = ("# Could not fetch the repository", False)
+
+    documentation_crew.generate_documentation(REPO)
+    documentation_crew.generate_documentation(REPO)
+
+    assert documentation_crew._run_learning_path_crew.call_count == 2
+    assert not list(tmp_path.glob("*.json"))
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('{"repository": "owner/repo", "info": {}}', True),
+    ('Tool output: {"error": "Repository not found: 404"}', False),
+    ("I could not use the tool.", False),
+])
+def test_fetch_output_is_checked_for_repository_data(raw, expected):
+    assert crew_module._is_repository_data(raw) is expected
+
+
+def test_drive_enabled_crew_bypasses_the_cache(documentation_crew, tmp_path):
+    documentation_crew.enable_google_drive = True
+
+    documentation_crew.generate_documentation(REPO)
+    documentation_crew.generate_documentation(REPO)
+
+    assert documentation_crew._run_learning_path_crew.call_count == 2
+    documentation_crew.github_tool._get_head_sha.assert_not_called()
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_fast_mode_is_ignored_when_drive_is_enabled(documentation_crew):
+    documentation_crew.enable_google_drive = True
+    documentation_crew._render_fast = mock.Mock(return_value="# Fast")
+
+    result = documentation_crew.generate_documentation(REPO, fast_mode=True)
+
+    assert result["documentation"] == "# Learning Path"
+    documentation_crew._render_fast.assert_not_called()
+
+
+def test_compact_context_minifies_json_and_drops_empty_fields():
+    raw = "Here is the data:\n" + json.dumps({
+        "repository": REPO,
+        "info": {"description": "", "topics": [], "license": None, "language": "Python"},
+        "code_snippets": {"main.py": {"content": "line 1\nline 2"}}
+    }, indent=2) + "\nDone."
+
+    compacted = crew_module._compact_context(raw)
+
+    assert compacted == (
+        '{"repository":"owner/repo","info":{"language":"Python"},'
+        '"code_snippets":{"main.py":{"content":"line 1\\nline 2"}}}'
+    )
+
+
+@pytest.mark.parametrize("raw", ["No JSON here", "{not json}", "[1, 2]"])
+def test_compact_context_returns_other_output_unchanged(raw):
+    assert crew_module._compact_context(raw) == raw
+
+
+def test_drive_tools_are_shared_and_reprobed_after_the_ttl(monkeypatch):
+    monkeypatch.setattr(crew_module, "_drive_tools", crew_module.TTLCache(maxsize=4, ttl=3600))
+    tool_class = mock.Mock()
+    monkeypatch.setattr(crew_module, "GoogleDriveMCPTool", tool_class)
+    with mock.patch.object(crew_module.time, "monotonic", return_value=1000.0) as monotonic:
+        first = crew_module._get_drive_tool("token", "https://mcp.test")
+        second = crew_module._get_drive_tool("token", "https://mcp.test")
+        first._initialize_mcp.assert_not_called()
+
+        monotonic.return_value = 1000.0 + crew_module.TOOL_AVAILABILITY_TTL
+        third = crew_module._get_drive_tool("token", "https://mcp.test")
+
+    assert first is second is third
+    tool_class.assert_called_once_with(access_token="token", mcp_url="https://mcp.test")
+    first._initialize_mcp.assert_called_once_with()
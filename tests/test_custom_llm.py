@@ -0,0 +1,19 @@
+"""Tests for the OpenAI LLM factory"""
+from src.config.constants import DEFAULT_LLM_MAX_RETRIES
+from src.llm.custom_llm import create_llm, create_writing_llm
+
+
+def test_create_llm_needs_no_github_settings(monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("LLM_MAX_RETRIES", raising=False)
+
+    llm = create_writing_llm(api_key="sk-x", model="gpt-4o")
+
+    assert llm.max_retries == DEFAULT_LLM_MAX_RETRIES
+
+
+def test_create_llm_reads_the_retry_budget_from_the_environment(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_RETRIES", "5")
+
+    assert create_llm(api_key="sk-x", model="gpt-4o").max_retries == 5
+    assert create_llm(api_key="sk-x", model="gpt-4o", max_retries=1).max_retries == 1
@@ -0,0 +1,104 @@
+"""Tests for GitHubCodeQATool caching"""
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.tools import github_code_qa_tool
+from src.tools.github_code_qa_tool import GitHubCodeQATool
+
+API_URL = "https://api.github.com"
+REPO = "owner/private-repo"
+
+
+def _make_tool(token: str, github_tool: mock.Mock) -> GitHubCodeQATool:
+    """Build a Code Q&A tool whose GitHub access goes through github_tool."""
+    settings = SimpleNamespace(github=SimpleNamespace(api_url=API_URL, token=token))
+    with mock.patch.object(github_code_qa_tool, "get_settings", return_value=settings), \
+            mock.patch("src.tools.github_tool.get_shared_github_tool", return_value=github_tool):
+        return GitHubCodeQATool()
+
+
+def _authorized_github_tool() -> mock.Mock:
+    github_tool = mock.Mock()
+    github_tool._get_repo_info.return_value = {"default_branch": "main"}
+    github_tool._get_head_sha.return_value = "a" * 40
+    github_tool._get_code_files_from_directory.return_value = {
+        "directory": "src",
+        "files_count": 1,
+        "files": {"src/secret.py": {"name": "secret.py", "path": "src/secret.py", "content": "KEY = 1"}}
+    }
+    return github_tool
+
+
+def _unauthorized_github_tool() -> mock.Mock:
+    github_tool = mock.Mock()
+    github_tool._get_repo_info.return_value = {"error": "Repository not found: 404"}
+    github_tool._get_head_sha.return_value = None
+    github_tool._get_code_files_from_directory.return_value = {"error": "Failed to fetch directory tree: 404"}
+    return github_tool
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (github_code_qa_tool._default_branches, github_code_qa_tool._head_shas,
+                  github_code_qa_tool._code_files):
+        cache.clear()
+    yield
+
+
+def test_cached_code_is_not_served_to_other_credentials():
+    owner_tool = _make_tool("owner-token", _authorized_github_tool())
+    owner_result = json.loads(owner_tool._run(REPO, "What is in secret.py?"))
+    assert owner_result["files"][0]["content"] == "KEY = 1"
+
+    other_github_tool = _unauthorized_github_tool()
+    other_tool = _make_tool("other-token", other_github_tool)
+    other_result = json.loads(other_tool._run(REPO, "What is in secret.py?"))
+
+    assert "error" in other_result
+    assert "files" not in other_result
+
+
+def test_cached_code_is_reused_for_the_same_credentials():
+    github_tool = _authorized_github_tool()
+    tool = _make_tool("owner-token", github_tool)
+
+    tool._run(REPO, "first question")
+    tool._run(REPO, "second question")
+
+    assert github_tool._get_code_files_from_directory.call_count == 1
+
+
+def test_branch_lookups_are_made_with_each_callers_credentials():
+    _make_tool("owner-token", _authorized_github_tool())._run(REPO, "question")
+
+    other_github_tool = _unauthorized_github_tool()
+    _make_tool("other-token", other_github_tool)._run(REPO, "question")
+
+    other_github_tool._get_repo_info.assert_called_once_with(REPO)
+    other_github_tool._get_head_sha.assert_not_called()
+
+
+def test_content_budget_truncates_files_and_drops_the_overflow(monkeypatch):
+    monkeypatch.setattr(github_code_qa_tool, "QA_MAX_CHARS_PER_FILE", 10)
+    monkeypatch.setattr(github_code_qa_tool, "QA_MAX_TOTAL_CHARS", 25)
+    files = [{"path": "a.py", "content": "a" * 15}, {"path": "b.py", "content": "b" * 5},
+             {"path": "c.py", "content": "c" * 20}, {"path": "d.py", "content": "d"}]
+
+    kept, dropped = github_code_qa_tool._apply_content_budget(files)
+
+    assert [entry["content"] for entry in kept] == [
+        "a" * 10 + "\n... [truncated]", "b" * 5, "c" * 10 + "\n... [truncated]"
+    ]
+    assert dropped == 1
+    assert files[0]["content"] == "a" * 15
+
+
+def test_content_budget_keeps_files_that_fit(monkeypatch):
+    monkeypatch.setattr(github_code_qa_tool, "QA_MAX_CHARS_PER_FILE", 10)
+    monkeypatch.setattr(github_code_qa_tool, "QA_MAX_TOTAL_CHARS", 25)
+    files = [{"path": "a.py", "content": "a" * 10}, {"path": "b.py", "content": None}]
+
+    assert github_code_qa_tool._apply_content_budget(files) == (files, 0)
@@ -0,0 +1,199 @@
+"""Tests for GitHubTool's conditional requests, GraphQL fallback and overview cache"""
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.tools import github_tool as github_tool_module
+from src.tools.github_tool import GitHubTool, get_shared_github_tool
+from src.utils.concurrency import IO_THREAD_PREFIX
+
+API_URL = "https://api.github.com"
+REPO = "owner/repo"
+HEAD_SHA = "a" * 40
+
+
+def _response(status_code, payload=None, headers=None, text=""):
+    """A requests.Response stand-in."""
+    response = mock.Mock(status_code=status_code, headers=headers or {}, text=text)
+    response.json.return_value = payload
+    return response
+
+
+def _overview(sha=HEAD_SHA):
+    """An analyzer result whose newest commit is sha."""
+    return {
+        "info": {"name": "repo"},
+        "file_structure": {"files": []},
+        "recent_commits": [{"sha": sha[:7], "message": "Latest"}],
+        "readme": "# Repo",
+        "code_snippets": {"message": "No key files found"}
+    }
+
+
+@pytest.fixture
+def github_tool():
+    settings = SimpleNamespace(github=SimpleNamespace(api_url=API_URL, token="token"))
+    with mock.patch.object(github_tool_module, "get_settings", return_value=settings):
+        tool = GitHubTool()
+    object.__setattr__(tool, "session", mock.Mock())
+    return tool
+
+
+def test_conditional_get_reuses_the_stored_response_on_304(github_tool):
+    fresh = _response(200, {"name": "repo"}, headers={"ETag": '"v1"'})
+    github_tool.session.get.side_effect = [fresh, _response(304)]
+    url = f"{API_URL}/repos/{REPO}"
+
+    first = github_tool._conditional_get(url, headers=github_tool.headers)
+    second = github_tool._conditional_get(url, headers=github_tool.headers)
+
+    assert first is fresh
+    assert second is fresh
+    first_headers = github_tool.session.get.call_args_list[0].kwargs["headers"]
+    second_headers = github_tool.session.get.call_args_list[1].kwargs["headers"]
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == '"v1"'
+
+
+def test_conditional_get_keys_stored_responses_by_accept_header(github_tool):
+    github_tool.session.get.side_effect = [
+        _response(200, headers={"ETag": '"json"'}),
+        _response(200, headers={"ETag": '"raw"'}),
+    ]
+    url = f"{API_URL}/repos/{REPO}/contents/setup.py"
+
+    github_tool._conditional_get(url, headers=github_tool.headers)
+    github_tool._conditional_get(url, headers=github_tool.raw_headers)
+
+    assert "If-None-Match" not in github_tool.session.get.call_args_list[1].kwargs["headers"]
+
+
+def test_graphql_errors_return_no_overview(github_tool):
+    github_tool.session.post.return_value = _response(200, {
+        "data": {"repository": {"name": "repo", "repositoryTopics": None, "issues": None}},
+        "errors": [{"message": "Resource not accessible by integration"}]
+    })
+
+    assert github_tool._get_repository_overview(REPO) is None
+
+
+def test_missing_optional_graphql_fields_default_to_empty(github_tool):
+    github_tool.session.post.return_value = _response(200, {"data": {"repository": {
+        "name": "repo",
+        "repositoryTopics": None,
+        "issues": None,
+        "pullRequests": {"totalCount": 2},
+        "defaultBranchRef": {"name": "main", "target": None}
+    }}})
+
+    overview = github_tool._get_repository_overview(REPO)
+
+    assert overview["info"]["open_issues_count"] == 2
+    assert overview["info"]["topics"] == []
+    assert overview["recent_commits"] == []
+
+
+def test_run_falls_back_to_rest_when_graphql_fails(github_tool):
+    with mock.patch.object(GitHubTool, "_get_head_sha", return_value=HEAD_SHA), \
+            mock.patch.object(GitHubTool, "_get_repository_overview", return_value=None), \
+            mock.patch.object(GitHubTool, "_get_repo_info", return_value={"name": "repo", "default_branch": "main"}), \
+            mock.patch.object(GitHubTool, "_get_file_structure", return_value={"files": []}), \
+            mock.patch.object(GitHubTool, "_get_recent_commits", return_value=[{"sha": HEAD_SHA[:7]}]), \
+            mock.patch.object(GitHubTool, "_get_readme", return_value="# Repo"), \
+            mock.patch.object(GitHubTool, "_get_code_snippets", return_value={}) as get_code_snippets:
+        result = json.loads(github_tool._run(REPO))
+
+    assert result["info"] == {"name": "repo", "default_branch": "main"}
+    assert result["recent_commits"] == [{"sha": HEAD_SHA[:7]}]
+    get_code_snippets.assert_called_once_with(REPO, "main", [])
+
+
+def test_overview_cache_is_keyed_by_head_sha(github_tool):
+    with mock.patch.object(GitHubTool, "_get_head_sha", return_value=HEAD_SHA) as get_head_sha, \
+            mock.patch.object(GitHubTool, "_get_repository_overview", return_value=_overview()) as get_overview:
+        github_tool._run(REPO)
+        github_tool._run(REPO)
+        assert get_overview.call_count == 1
+
+        pushed = "b" * 40
+        get_head_sha.return_value = pushed
+        get_overview.return_value = _overview(pushed)
+        result = json.loads(github_tool._run(REPO))
+
+    assert get_overview.call_count == 2
+    assert result["recent_commits"][0]["sha"] == pushed[:7]
+
+
+def test_overview_is_not_cached_when_a_push_lands_mid_fetch(github_tool):
+    with mock.patch.object(GitHubTool, "_get_head_sha", return_value=HEAD_SHA), \
+            mock.patch.object(GitHubTool, "_get_repository_overview", return_value=_overview("c" * 40)) as get_overview:
+        github_tool._run(REPO)
+        github_tool._run(REPO)
+
+    assert get_overview.call_count == 2
+
+
+def test_shared_tool_uses_the_credentials_it_is_keyed_by():
+    other_user = SimpleNamespace(github=SimpleNamespace(api_url=API_URL, token="other-token"))
+    with mock.patch.object(github_tool_module, "get_settings", return_value=other_user) as get_settings:
+        tool = get_shared_github_tool(API_URL + "/", "owner-token-for-shared-test")
+
+    get_settings.assert_not_called()
+    assert tool.token == "owner-token-for-shared-test"
+    assert tool.headers["Authorization"] == "Bearer owner-token-for-shared-test"
+    assert tool.raw_headers["Authorization"] == "Bearer owner-token-for-shared-test"
+    assert tool.graphql_url == API_URL + "/graphql"
+
+
+def test_overview_falls_back_to_rest_for_unprobed_readme_names(github_tool):
+    github_tool.session.post.return_value = _response(200, {"data": {"repository": {
+        "name": "repo",
+        "defaultBranchRef": {"name": "main", "target": None}
+    }}})
+
+    with mock.patch.object(GitHubTool, "_get_readme", return_value="# From Readme.md") as get_readme:
+        overview = github_tool._get_repository_overview(REPO)
+
+    assert overview["readme"] == "# From Readme.md"
+    get_readme.assert_called_once_with(REPO)
+
+
+def test_overview_uses_a_probed_readme_without_rest(github_tool):
+    readme_field = f"f{len(github_tool_module._KEY_FILES)}"
+    github_tool.session.post.return_value = _response(200, {"data": {"repository": {
+        "name": "repo",
+        "defaultBranchRef": {"name": "main", "target": None},
+        readme_field: {"text": "# From README.md"}
+    }}})
+
+    with mock.patch.object(GitHubTool, "_get_readme") as get_readme:
+        overview = github_tool._get_repository_overview(REPO)
+
+    assert overview["readme"] == "# From README.md"
+    get_readme.assert_not_called()
+
+
+@pytest.mark.parametrize("status_code, cached", [(404, True), (403, False), (503, False)])
+def test_only_a_missing_readme_is_cached(github_tool, status_code, cached):
+    with mock.patch.object(GitHubTool, "_get_raw_head", return_value=(status_code, b"")):
+        readme = github_tool._get_readme(REPO)
+
+    result = dict(_overview(), readme=readme)
+    github_tool._cache_overview((REPO, HEAD_SHA), result)
+
+    assert (len(github_tool._overview_cache) == 1) is cached
+
+
+def test_arun_runs_the_fetch_on_the_io_pool(github_tool):
+    def fetch(self, repo):
+        return json.dumps({"repository": repo, "thread": threading.current_thread().name})
+
+    with mock.patch.object(GitHubTool, "_run", fetch):
+        result = json.loads(asyncio.run(github_tool.arun(REPO)))
+
+    assert result["repository"] == REPO
+    assert result["thread"].startswith(IO_THREAD_PREFIX)
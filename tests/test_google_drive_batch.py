@@ -0,0 +1,130 @@
+"""Tests for GoogleDriveMCPTool's batch_execute client and async entry point"""
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.tools import google_drive_tool
+from src.tools.google_drive_tool import GoogleDriveMCPTool
+from src.utils.concurrency import IO_THREAD_PREFIX
+
+CALLS = [
+    {"tool": "get_file", "arguments": {"uri": "gdrive:///one", "access_token": "token"}},
+    {"tool": "get_file", "arguments": {"uri": "gdrive:///two", "access_token": "token"}},
+]
+
+
+def _tool_result(payload, is_error=False):
+    """An MCP tool result whose text content is payload as JSON."""
+    return {"content": [{"type": "text", "text": json.dumps(payload)}], "isError": is_error}
+
+
+def _response(batch_payload, status_code=200):
+    """A tools/call response wrapping a batch_execute payload."""
+    response = mock.Mock(status_code=status_code)
+    response.json.return_value = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "result": {"content": [{"type": "text", "text": json.dumps(batch_payload)}]}
+    }
+    return response
+
+
+@pytest.fixture
+def drive_tool():
+    settings = SimpleNamespace(google_drive=SimpleNamespace(token=None, mcp_url="mcp.test"))
+    with mock.patch.object(google_drive_tool, "get_settings", return_value=settings):
+        tool = GoogleDriveMCPTool()
+    object.__setattr__(tool, "access_token", "token")
+    object.__setattr__(tool, "_session", mock.Mock())
+    object.__setattr__(tool, "_initialized", True)
+    object.__setattr__(tool, "_supports_batch", True)
+    return tool
+
+
+def test_batch_request_follows_the_server_contract(drive_tool):
+    drive_tool._session.post.return_value = _response([_tool_result({}), _tool_result({})])
+
+    drive_tool._batch_mcp(CALLS)
+
+    request = drive_tool._session.post.call_args.kwargs["json"]
+    assert request["method"] == "tools/call"
+    assert request["params"] == {
+        "name": "batch_execute",
+        "arguments": {"operations": CALLS, "maxConcurrent": 2}
+    }
+    assert drive_tool._session.post.call_args.kwargs["timeout"] == google_drive_tool.MCP_GET_FILE_TIMEOUT
+
+
+@pytest.mark.parametrize("wrap", [lambda results: results, lambda results: {"results": results}])
+def test_batch_results_are_parsed_in_operation_order(drive_tool, wrap):
+    drive_tool._session.post.return_value = _response(wrap([
+        _tool_result({"content": "first"}),
+        _tool_result({"content": "second"}),
+    ]))
+
+    assert drive_tool._batch_mcp(CALLS) == [{"content": "first"}, {"content": "second"}]
+
+
+def test_failed_operations_become_empty_results(drive_tool):
+    drive_tool._session.post.return_value = _response([
+        _tool_result({"error": "not found"}, is_error=True),
+        {"content": [{"type": "text", "text": "not json"}]},
+    ])
+
+    assert drive_tool._batch_mcp(CALLS) == [{}, {}]
+
+
+@pytest.mark.parametrize("batch_payload", [
+    [_tool_result({"content": "only one"})],
+    {"unexpected": "shape"},
+])
+def test_unexpected_payloads_fail_the_whole_batch(drive_tool, batch_payload):
+    drive_tool._session.post.return_value = _response(batch_payload)
+
+    assert drive_tool._batch_mcp(CALLS) is None
+
+
+def test_failed_batch_disables_batching(drive_tool):
+    drive_tool._session.post.return_value = _response([], status_code=500)
+
+    assert drive_tool._get_file_previews_batched(["gdrive:///one", "gdrive:///two"]) is None
+    assert drive_tool._supports_batch is False
+
+
+def test_arun_searches_and_fetches_off_the_event_loop(drive_tool):
+    object.__setattr__(drive_tool, "_supports_batch", False)
+    threads = []
+
+    def get_file(self, uri):
+        threads.append(threading.current_thread().name)
+        return {"content": f"body of {uri}"}
+
+    search_results = [{"uri": "gdrive:///one", "name": "One"}, {"uri": "gdrive:///two", "name": "Two"}]
+    with mock.patch.object(GoogleDriveMCPTool, "_search_files", return_value=search_results), \
+            mock.patch.object(GoogleDriveMCPTool, "_get_file", get_file):
+        result = json.loads(asyncio.run(drive_tool.arun("design doc")))
+
+    assert [file["content"] for file in result["files"]] == ["body of gdrive:///one", "body of gdrive:///two"]
+    assert len(threads) == 2
+    assert all(name.startswith(IO_THREAD_PREFIX) for name in threads)
+
+
+def test_reprobe_keeps_the_tool_available_until_the_result_is_known(drive_tool):
+    seen_during_probe = []
+
+    def probe(*args, **kwargs):
+        seen_during_probe.append((drive_tool.is_available(), drive_tool._supports_batch))
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"result": {"tools": [{"name": "search"}]}}
+        return response
+
+    drive_tool._session.post.side_effect = probe
+    drive_tool._initialize_mcp()
+
+    assert seen_during_probe == [(True, True)]
+    assert drive_tool.is_available() is True
+    assert drive_tool._supports_batch is False
@@ -1,4 +1,5 @@
 """Test script for Google Drive MCP Tool"""
+import os
 import sys
 from pathlib import Path
 import json
@@ -7,87 +8,87 @@ import json
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
 
-from src.tools import GoogleDriveMCPTool
 from src.config.settings import get_settings
 
 
+def _print_section(title: str, rule: str = "=", leading_newline: bool = True) -> None:
+    """Print a section header between two rules in a single write."""
+    line = rule * 60
+    prefix = "\n" if leading_newline else ""
+    print(f"{prefix}{line}\n{title}\n{line}")
+
+
 def test_drive_tool():
     """Test Google Drive MCP tool functionality."""
-    print("=" * 60)
-    print("Google Drive MCP Integration Test")
-    print("=" * 60)
+    _print_section("Google Drive MCP Integration Test", leading_newline=False)
 
     try:
         settings = get_settings()
 
         if not settings.google_drive.token:
-            print("\n❌ Error: GOOGLE_DRIVE_TOKEN not found in environment")
-            print("Please set GOOGLE_DRIVE_TOKEN in your .env file")
+            print("\n❌ Error: GOOGLE_DRIVE_TOKEN not found in environment\n"
+                  "Please set GOOGLE_DRIVE_TOKEN in your .env file")
             return 1
 
-        print(f"\n✅ Google Drive access token found (length: {len(settings.google_drive.token)} chars)")
-        print(f"✅ MCP server URL: {settings.google_drive.mcp_url}")
+        print(f"\n✅ Google Drive access token found (length: {len(settings.google_drive.token)} chars)\n"
+              f"✅ MCP server URL: {settings.google_drive.mcp_url}")
 
         # Initialize the tool
-        print("\n" + "-" * 60)
-        print("Initializing Google Drive MCP tool...")
-        print("-" * 60)
+        _print_section("Initializing Google Drive MCP tool...", rule="-")
+
+        # Imported only once settings are known to be usable, since loading
+        # the tools pulls in CrewAI
+        from src.tools import GoogleDriveMCPTool
 
         tool = GoogleDriveMCPTool()
 
         if not tool.is_available():
-            print("\n❌ Google Drive MCP tool is not available")
-            print("Make sure the MCP server is running at:", settings.google_drive.mcp_url)
+            print("\n❌ Google Drive MCP tool is not available\n"
+                  f"Make sure the MCP server is running at: {settings.google_drive.mcp_url}")
             return 1
 
         print("\n✅ Google Drive MCP tool initialized successfully")
 
         # Test search functionality
-        print("\n" + "=" * 60)
-        print("TEST: Search for documents")
-        print("=" * 60)
+        _print_section("TEST: Search for documents")
 
-        search_query = input("\nEnter search query (or press Enter for 'documentation'): ").strip()
-        if not search_query:
-            search_query = "documentation"
+        # Read the query from the environment so the test runs unattended
+        search_query = os.getenv("DRIVE_TEST_QUERY", "").strip() or "documentation"
 
         print(f"\nSearching for: '{search_query}'...")
 
-        result = tool._run(search_query)
-        result_data = json.loads(result)
+        # Only the first 500 characters of each file are displayed below; the
+        # dict form skips the tool's JSON encoding and parsing it back here
+        result_data = tool._run_native(search_query, preview_len=500)
+        result = json.dumps(result_data, indent=2)
 
-        print("\n" + "-" * 60)
-        print("Search Results:")
-        print("-" * 60)
-        print(json.dumps(result_data, indent=2))
+        _print_section("Search Results:", rule="-")
+        print(result)
 
-        # Save to file
+        # Save to file, reusing the JSON already rendered for display
         output_file = "drive_search_results.json"
-        with open(output_file, 'w') as f:
-            json.dump(result_data, f, indent=2)
+        Path(output_file).write_text(result, encoding="utf-8")
         print(f"\n✅ Search results saved to: {output_file}")
 
         # Display first file content preview
-        if result_data.get("files_found", 0) > 0:
-            print("\n" + "=" * 60)
-            print("File Content Preview")
-            print("=" * 60)
-
-            first_file = result_data.get("files", [])[0]
-            print(f"\nFile: {first_file.get('name')}")
-            print(f"URI: {first_file.get('uri')}")
-            print(f"\nContent preview (first 500 chars):")
-            print("-" * 60)
-            content = first_file.get('content', '')
-            print(content[:500])
-            if len(content) > 500:
-                print(f"\n... ({len(content) - 500} more characters)")
-
-        print("\n" + "=" * 60)
-        print("✅ All tests completed successfully!")
-        print("=" * 60)
-        print("\nYou can now use Google Drive integration with your documentation agent:")
-        print("python scripts/run_documentation_agent.py namespace/project --with-drive")
+        if result_data.get("files"):
+            _print_section("File Content Preview")
+
+            first_file = result_data["files"][0]
+            print(f"\nFile: {first_file.get('name')}\n"
+                  f"URI: {first_file.get('uri')}\n"
+                  f"\nContent preview (first 500 chars):\n"
+                  + "-" * 60)
+            # The tool already cut the content to 500 chars and reports the full length
+            preview = first_file.get('content', '')
+            print(preview)
+            remaining = first_file.get('full_content_length', len(preview)) - len(preview)
+            if remaining > 0:
+                print(f"\n... ({remaining} more characters)")
+
+        _print_section("✅ All tests completed successfully!")
+        print("\nYou can now use Google Drive integration with your documentation agent:\n"
+              "python scripts/run_documentation_agent.py namespace/project --with-drive")
 
         return 0
 